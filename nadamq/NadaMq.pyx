@@ -7,9 +7,15 @@ from cython.operator cimport dereference as deref
 from libc.stdint cimport uint16_t
 from libc.stdlib cimport malloc, free
 from libc.string cimport memcpy
+from libcpp.deque cimport deque as cpp_deque
 from libcpp.string cimport string
+from libcpp.vector cimport vector
 
-from cpython.bytes cimport PyBytes_AS_STRING
+from cpython.buffer cimport PyBuffer_FillInfo
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
+from cpython.ref cimport PyObject, Py_INCREF, Py_DECREF
+
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -51,7 +57,7 @@ PACKET_TYPES = _PacketTypes()
 FLAGS = _Flags()
 
 
-cdef extern from "PacketParser.h":
+cdef extern from "PacketParser.h" nogil:
     cdef enum packet_type "Packet::packet_type::EnumType":
         PACKET_TYPE_NONE "Packet::packet_type::NONE"
         PACKET_TYPE_ACK "Packet::packet_type::ACK"
@@ -74,6 +80,7 @@ cdef extern from "PacketParser.h":
         uchar type()
         void type(uchar command_with_type_msb)
         void compute_crc()
+        void reset()
 
     cdef cppclass PacketParser "PacketParser<FixedPacket>":
         int payload_bytes_received_
@@ -84,29 +91,31 @@ cdef extern from "PacketParser.h":
 
         PacketParser()
         void parse_byte(uchar *byte)
+        size_t parse_buffer(const uchar *data, size_t length)
         void reset(FixedPacket *packet)
 
+    size_t find_start_flag(const uchar *data, size_t length)
+
 
-cdef extern from "crc-16.h":
+cdef extern from "crc-16.h" nogil:
     crc_t c_crc_init "crc_init" ()
     crc_t c_crc_finalize "crc_finalize" (crc_t crc)
-    crc_t c_crc_update "crc_update" (crc_t crc, uchar *data, size_t data_len)
+    crc_t c_crc_update "crc_update" (crc_t crc, const uchar *data, size_t data_len)
     crc_t c_crc_update_byte "crc_update_byte" (crc_t crc, uchar data)
 
 
-cdef extern from "<sstream>" namespace "std":
-    cdef cppclass stringstream:
-        stringstream()
-        string str_ "str" ()
-
-
-cdef extern from "PacketWriter.h":
-    void write_packet(stringstream output, FixedPacket packet)
+cdef extern from "PacketWriter.h" nogil:
+    size_t packet_serialized_size(const FixedPacket &packet)
+    size_t write_packet_buffer(uchar *output, const FixedPacket &packet)
 
 
 cdef class cPacket:
     cdef FixedPacket *thisptr
     cdef unsigned char *buffer_
+    # Number of buffer views currently exported (see `__getbuffer__`).
+    cdef int exports_
+    # Packet is reused by a `cPacketParser` for each parsed packet.
+    cdef bint reused_
 
     def __cinit__(self, type_=PACKET_TYPES.NONE, iuid=0, data=None,
                   buffer_=None, buffer_size=None):
@@ -154,13 +163,24 @@ cdef class cPacket:
           the size of the buffer.
          - This method updates the CRC checksum of the packet, based on the new
           payload contents.
+
+        .. versionchanged:: 0.16
+            Raise :class:`BufferError` while the payload buffer is exported
+            (see :meth:`payload_view`).
         """
+        self._check_exports()
         if data.size() > self.thisptr.buffer_size_:
             raise ValueError(f'Data length is too large for buffer, {data.size()} > {self.thisptr.buffer_size_}')
 
-        memcpy(self.thisptr.payload_buffer_, data.c_str(), data.size())
-        self.thisptr.payload_length_ = data.size()
-        self.thisptr.compute_crc()
+        # Pin the payload buffer while it is written with the GIL released.
+        self.exports_ += 1
+        try:
+            with nogil:
+                memcpy(self.thisptr.payload_buffer_, data.c_str(), data.size())
+                self.thisptr.payload_length_ = data.size()
+                self.thisptr.compute_crc()
+        finally:
+            self.exports_ -= 1
 
     def data(self):
         """
@@ -174,10 +194,71 @@ cdef class cPacket:
         """
         return <size_t>self.thisptr.payload_buffer_
 
+    def copy(self):
+        """
+        Return a copy of the packet with its own payload buffer.
+
+        This is useful to keep a packet returned by :class:`cPacketParser`,
+        since the parser reuses the same packet (and buffer) for each parsed
+        packet.
+
+        .. versionadded:: 0.16
+
+        Returns
+        -------
+        cPacket
+            Copy of packet.
+        """
+        cdef uint16_t length = self.thisptr.payload_length_
+        cdef cPacket packet = cPacket(type_=self.type_, iuid=self.iuid,
+                                      buffer_size=max(length, 1))
+        if self.thisptr.payload_buffer_ != NULL:
+            memcpy(packet.thisptr.payload_buffer_, self.thisptr.payload_buffer_, length)
+        packet.thisptr.payload_length_ = length
+        packet.thisptr.crc_ = self.thisptr.crc_
+        return packet
+
+    def payload_view(self):
+        """
+        Return a writable :class:`memoryview` of the payload, without copying.
+
+        For example, ``np.frombuffer(packet.payload_view(), dtype='uint16')``.
+
+        .. versionadded:: 0.16
+
+        Notes
+        =====
+
+         - The view covers the payload length at the time the view is created.
+         - While a view exists, the payload buffer may not be cleared,
+           replaced, or overwritten using :meth:`set_data`.
+        """
+        return memoryview(self)
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        """
+        Expose ``payload_buffer_[:payload_length_]`` through the buffer
+        protocol.
+
+        .. versionadded:: 0.16
+        """
+        if self.thisptr.payload_buffer_ == NULL:
+            raise BufferError('No buffer has been set/allocated.')
+        PyBuffer_FillInfo(buffer, self, self.thisptr.payload_buffer_,
+                          self.thisptr.payload_length_, 0, flags)
+        self.exports_ += 1
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        self.exports_ -= 1
+
+    cdef _check_exports(self):
+        if self.exports_ > 0:
+            raise BufferError(f'Payload buffer is in use by {self.exports_} exported view(s).')
+
     def tobytes(self) -> bytes:
         """
-        Serialize a packet according to format defined in the `write_packet` C++
-        function.
+        Serialize a packet according to format defined in the
+        `write_packet_buffer` C++ function.
 
         Returns
         -------
@@ -188,7 +269,7 @@ cdef class cPacket:
 
     def tostring(self) -> bytes:
         """
-        Serialize a packet according to format defined in the `write_packet` C++ function.
+        Serialize a packet according to format defined in the `write_packet_buffer` C++ function.
 
         Returns
         -------
@@ -197,10 +278,73 @@ cdef class cPacket:
 
 
         .. versionadded:: 0.15
+
+        .. versionchanged:: 0.16
+            Write directly into the returned :class:`bytes` object (see
+            :meth:`pack_into`), with the GIL released.
+        """
+        cdef bytes output = PyBytes_FromStringAndSize(NULL, self.serialized_size)
+        cdef uchar *output_ptr = <uchar *>PyBytes_AS_STRING(output)
+
+        # Pin the payload buffer while it is read with the GIL released.
+        self.exports_ += 1
+        try:
+            with nogil:
+                write_packet_buffer(output_ptr, deref(self.thisptr))
+        finally:
+            self.exports_ -= 1
+        return output
+
+    def pack_into(self, uchar [::1] buffer, Py_ssize_t offset=0) -> int:
         """
-        cdef stringstream output
-        write_packet(output, deref(self.thisptr))
-        return output.str_()
+        Serialize the packet (start flag, iuid, type, length, payload, CRC)
+        directly into a writable buffer, e.g., a preallocated
+        :class:`bytearray`.
+
+        The CRC checksum is computed from the current payload contents.
+
+        .. versionadded:: 0.16
+
+        Parameters
+        ----------
+        buffer : bytearray, memoryview, numpy.ndarray, ...
+            Writable, C-contiguous buffer.
+        offset : int, optional
+            Offset in :data:`buffer` to start writing at.
+
+        Returns
+        -------
+        int
+            Number of bytes written, i.e., :attr:`serialized_size`.
+
+        Raises
+        ------
+        ValueError
+            If the packet does not fit in :data:`buffer` at :data:`offset`.
+        """
+        cdef size_t size = self.serialized_size
+        cdef uchar *output_ptr
+
+        if offset < 0 or offset > buffer.shape[0] or <size_t>(buffer.shape[0] - offset) < size:
+            raise ValueError(f'Packet does not fit in buffer, {size} bytes at offset {offset} > {buffer.shape[0]}')
+        output_ptr = &buffer[0] + offset
+        # Pin the payload buffer while it is read with the GIL released.
+        self.exports_ += 1
+        try:
+            with nogil:
+                size = write_packet_buffer(output_ptr, deref(self.thisptr))
+        finally:
+            self.exports_ -= 1
+        return size
+
+    property serialized_size:
+        def __get__(self):
+            """
+            Number of bytes in the serialized packet.
+
+            .. versionadded:: 0.16
+            """
+            return packet_serialized_size(deref(self.thisptr))
 
     property crc:
         def __get__(self):
@@ -226,6 +370,7 @@ cdef class cPacket:
         """
         Deallocate buffer (if it has been allocated).
         """
+        self._check_exports()
         if self.buffer_ != NULL:
             free(self.buffer_)
             self.buffer_ = NULL
@@ -259,6 +404,7 @@ cdef class cPacket:
         if self.thisptr.payload_buffer_ != NULL and not overwrite:
             raise RuntimeError('Packet already has a payload buffer '
                                'allocated.  Must use `overwrite=True` to set buffer anyway.')
+        self._check_exports()
         self.thisptr.payload_buffer_ = &data[0]
         self.thisptr.buffer_size_ = len(data)
         self.thisptr.payload_length_ = 0
@@ -274,10 +420,38 @@ cdef class cPacket:
 cdef class cPacketParser:
     cdef PacketParser *thisptr
     cdef object packet
-
-    def __cinit__(self, buffer_size=8 << 10):
+    cdef public bint resync
+    cdef public bint skip_garbage
+    cdef readonly size_t dropped_bytes
+    cdef readonly size_t resync_count
+    cdef readonly size_t skipped_bytes
+    # Bytes of the current (incomplete) frame consumed by previous calls.
+    cdef size_t pending_bytes_
+
+    def __cinit__(self, buffer_size=8 << 10, resync=False, skip_garbage=False):
+        """
+        .. versionchanged:: 0.16
+            Add :data:`resync` and :data:`skip_garbage` arguments.
+
+        Parameters
+        ----------
+        buffer_size : int, optional
+            Size of payload buffer.
+        resync : bool, optional
+            If ``True``, recover from parse errors by resuming from the next
+            ``|||`` start flag (see :meth:`iter_packets`) instead of raising.
+        skip_garbage : bool, optional
+            If ``True``, bytes between packets (e.g., debug output, or a
+            partial packet when attaching mid-stream) are skipped up to the
+            next ``|||`` start flag before they reach the parser, and counted
+            in :attr:`skipped_bytes`.  This includes a partial start flag at
+            the end of a buffer, which is not completed by the next buffer.
+        """
         self.thisptr = new PacketParser()
         self.packet = cPacket(buffer_size=buffer_size)
+        (<cPacket>self.packet).reused_ = True
+        self.resync = resync
+        self.skip_garbage = skip_garbage
         self.reset()
 
     def __dealloc__(self):
@@ -285,17 +459,168 @@ cdef class cPacketParser:
 
     def reset(self):
         self.thisptr.reset((<cPacket>self.packet).thisptr)
+        self.pending_bytes_ = 0
+
+    cdef int _parse_next(self, const uchar *data, size_t length,
+                         size_t *offset) except -1:
+        """
+        Parse from ``data[offset[0]:length]`` until a packet is completed.
+
+        In :attr:`resync` mode, a parse error drops the bytes of the corrupted
+        frame, i.e., up to the next start flag after the start of the frame,
+        and parsing resumes from there.
 
-    def parse(self, uchar [:] packet_buffer):
-        cdef int i
-        for i in range(len(packet_buffer)):
-            self.thisptr.parse_byte(<uchar *>&packet_buffer[i])
-            if self.error:
-                raise RuntimeError(f'Error parsing packet [byte={i}]: {np.asarray(packet_buffer).tobytes()}')
-            elif self.message_completed:
-                return self.packet
+        Returns
+        -------
+        int
+            ``1`` if a packet was completed, ``0`` if all bytes were consumed
+            without completing a packet, or ``2`` on a parse error (only if
+            :attr:`resync` is ``False``), including if the parser is still in
+            the error state from a previous call (i.e., until :meth:`reset`
+            is called).
+        """
+        cdef size_t frame_start = offset[0]
+        cdef size_t scan_start
+        cdef size_t consumed
+        cdef cPacket packet = <cPacket>self.packet
+
+        if self.thisptr.parse_error_:
+            return 2
+        while offset[0] < length:
+            if (self.skip_garbage and not self.pending_bytes_ and
+                    offset[0] == frame_start):
+                # The parser is expecting a start flag, so jump straight to
+                # the next candidate.
+                consumed = find_start_flag(data + offset[0], length - offset[0])
+                self.skipped_bytes += consumed
+                frame_start = offset[0] = offset[0] + consumed
+                if offset[0] == length:
+                    break
+            # Pin the payload buffer of the parsed packet while it is written
+            # with the GIL released.
+            packet.exports_ += 1
+            try:
+                with nogil:
+                    consumed = self.thisptr.parse_buffer(data + offset[0],
+                                                         length - offset[0])
+            finally:
+                packet.exports_ -= 1
+            offset[0] += consumed
+            if (self.thisptr.parse_error_ and self.skip_garbage and
+                    consumed > 0 and offset[0] > frame_start and
+                    self.pending_bytes_ + offset[0] - frame_start <= 3):
+                # The offending byte is part of the start flag, i.e., a
+                # partial start flag at the end of the previous buffer was not
+                # completed.  Skip it as garbage and resume the scan from the
+                # offending byte.
+                self.skipped_bytes += self.pending_bytes_ + offset[0] - 1 - frame_start
+                self.reset()
+                frame_start = offset[0] = offset[0] - 1
+                continue
+            if self.thisptr.parse_error_:
+                if not self.resync:
+                    return 2
+                # Rescan the frame (excluding its own start flag, unless it
+                # started in a previous buffer) for the next start flag.
+                scan_start = frame_start if self.pending_bytes_ else frame_start + 1
+                scan_start += find_start_flag(data + scan_start,
+                                              length - scan_start)
+                self.dropped_bytes += self.pending_bytes_ + scan_start - frame_start
+                self.resync_count += 1
+                self.reset()
+                frame_start = offset[0] = scan_start
+            elif self.thisptr.message_completed_:
+                self.pending_bytes_ = 0
+                return 1
+        self.pending_bytes_ += length - frame_start
+        return 0
+
+    def parse(self, const uchar [::1] packet_buffer):
+        """
+        Parse bytes from :data:`packet_buffer` until a packet is completed.
+
+        .. versionchanged:: 0.16
+            Run the C++ parser across the whole buffer in a single call to
+            ``PacketParser::parse_buffer`` (rather than once per byte).
+            Accept read-only buffers (e.g., :class:`bytes`).
+
+        Returns
+        -------
+        cPacket or bool
+            Parsed packet, or ``False`` if no packet was completed.
+
+        Raises
+        ------
+        RuntimeError
+            If a parse error is encountered (and :attr:`resync` is
+            ``False``).
+        """
+        cdef size_t length = packet_buffer.shape[0]
+        cdef size_t offset = 0
+        cdef int result
+
+        if length == 0:
+            return False
+        result = self._parse_next(&packet_buffer[0], length, &offset)
+        if result == 2:
+            raise RuntimeError(f'Error parsing packet [byte={offset - 1 if offset > 0 else 0}]: {np.asarray(packet_buffer).tobytes()}')
+        elif result == 1:
+            return self.packet
         return False
 
+    def iter_packets(self, const uchar [::1] packet_buffer):
+        """
+        Parse all bytes from :data:`packet_buffer`, yielding each completed
+        packet.
+
+        Any trailing partial packet is retained in the parser state, so the
+        remaining bytes of the packet may be passed in the next call.
+
+        In :attr:`resync` mode, a corrupted frame only costs its own bytes:
+        the parser is reset and resumes from the next ``|||`` start flag
+        found after the start of the corrupted frame.  Dropped bytes are
+        counted in :attr:`dropped_bytes` and each recovery in
+        :attr:`resync_count`.
+
+        .. versionadded:: 0.16
+
+        Yields
+        ------
+        cPacket
+            Copy of each parsed packet (see :meth:`cPacket.copy`).
+
+        Raises
+        ------
+        RuntimeError
+            If a parse error is encountered (and :attr:`resync` is
+            ``False``).  Packets completed before the error have already been
+            yielded.
+        """
+        cdef size_t length = packet_buffer.shape[0]
+        cdef size_t offset = 0
+        cdef int result
+
+        while offset < length:
+            result = self._parse_next(&packet_buffer[0], length, &offset)
+            if result == 2:
+                raise RuntimeError(f'Error parsing packet [byte={offset - 1 if offset > 0 else 0}]: {np.asarray(packet_buffer).tobytes()}')
+            elif result == 1:
+                yield self.packet.copy()
+
+    def parse_all(self, const uchar [::1] packet_buffer):
+        """
+        Parse all bytes from :data:`packet_buffer`.
+
+        .. versionadded:: 0.16
+
+        Returns
+        -------
+        list[cPacket]
+            Copy of each packet completed in :data:`packet_buffer` (see
+            :meth:`iter_packets`).
+        """
+        return list(self.iter_packets(packet_buffer))
+
     property message_completed:
         def __get__(self):
             return self.thisptr.message_completed_
@@ -309,6 +634,180 @@ cdef class cPacketParser:
             return self.thisptr.crc_
 
 
+cdef struct _PayloadChunk:
+    # Owned reference to the queued `cPacket`, which keeps `data` alive.
+    PyObject *packet
+    const uchar *data
+    size_t length
+
+
+cdef class cPacketStream:
+    """
+    Continuous byte stream reassembled from the payloads of a sequence of
+    packets, e.g., a large blob sent as consecutive ``STREAM`` packets.
+
+    Python analogue of the C++ ``PacketStream``: pushed packets are queued
+    as-is, and :meth:`read`/:meth:`readinto` copy payload bytes straight from
+    the packet buffers into the output, without intermediate copies.
+
+    While a packet is queued, its payload buffer is held as if exported
+    (see :meth:`cPacket.payload_view`), i.e., it may not be cleared,
+    replaced, or overwritten using :meth:`cPacket.set_data`.
+
+    .. versionadded:: 0.16
+
+    Parameters
+    ----------
+    packet_type : int, optional
+        Type of packets accepted by :meth:`push` (``PACKET_TYPES.STREAM`` by
+        default).  If ``None``, packets of any type are accepted.
+    """
+    # Payload of each queued packet at the time it was pushed.  Packet
+    # references are held at the C level (rather than in a Python container)
+    # so that `__dealloc__` can release them even after the cyclic garbage
+    # collector has cleared the Python attributes of the stream.
+    cdef cpp_deque[_PayloadChunk] chunks_
+    # Read offset in the payload at the head of the queue.
+    cdef size_t offset_
+    cdef readonly size_t available
+    cdef public object packet_type
+
+    def __cinit__(self, packet_type=PACKET_TYPES.STREAM):
+        self.offset_ = 0
+        self.available = 0
+        self.packet_type = packet_type
+
+    def __dealloc__(self):
+        self.clear()
+
+    def push(self, cPacket packet):
+        """
+        Append the payload of a packet to the end of the stream.
+
+        The packet is queued by reference, except for the packet reused by a
+        :class:`cPacketParser` for each parsed packet (e.g., as returned by
+        :meth:`cPacketParser.parse`), which is copied.
+
+        Raises
+        ------
+        ValueError
+            If the packet type does not match :attr:`packet_type`.
+        """
+        cdef _PayloadChunk chunk
+
+        if self.packet_type is not None and packet.type_ != self.packet_type:
+            raise ValueError(f'Unexpected packet type: {packet.type_} (expected {self.packet_type})')
+        if packet.thisptr.payload_length_ == 0:
+            return
+        if packet.reused_:
+            packet = packet.copy()
+        chunk.packet = <PyObject *>packet
+        chunk.data = packet.thisptr.payload_buffer_
+        chunk.length = packet.thisptr.payload_length_
+        packet.exports_ += 1
+        Py_INCREF(packet)
+        self.chunks_.push_back(chunk)
+        self.available += chunk.length
+
+    def extend(self, packets):
+        """
+        Push each packet from an iterable (see :meth:`push`).
+        """
+        for packet in packets:
+            self.push(packet)
+
+    cdef _release_head(self):
+        cdef PyObject *packet = self.chunks_.front().packet
+
+        self.chunks_.pop_front()
+        self.offset_ = 0
+        (<cPacket>packet).exports_ -= 1
+        Py_DECREF(<object>packet)
+
+    cdef size_t _read_into(self, uchar *output, size_t length):
+        """
+        Copy up to :data:`length` bytes from the head of the stream to
+        :data:`output`, releasing each exhausted packet.
+
+        Returns
+        -------
+        size_t
+            Number of bytes copied.
+        """
+        cdef size_t count = 0
+        cdef size_t size
+
+        while count < length and not self.chunks_.empty():
+            size = min(self.chunks_.front().length - self.offset_,
+                       length - count)
+            with nogil:
+                memcpy(output + count, self.chunks_.front().data +
+                       self.offset_, size)
+            count += size
+            self.offset_ += size
+            if self.offset_ == self.chunks_.front().length:
+                self._release_head()
+        self.available -= count
+        return count
+
+    def read(self, Py_ssize_t count=-1) -> bytes:
+        """
+        Read bytes from the stream.
+
+        Parameters
+        ----------
+        count : int, optional
+            Maximum number of bytes to read.  If negative, read all available
+            bytes.
+
+        Returns
+        -------
+        bytes
+            Up to :data:`count` bytes (empty if no bytes are available).
+        """
+        cdef size_t length = self.available
+        cdef bytes output
+
+        if 0 <= count < <Py_ssize_t>length:
+            length = count
+        output = PyBytes_FromStringAndSize(NULL, length)
+        self._read_into(<uchar *>PyBytes_AS_STRING(output), length)
+        return output
+
+    def readinto(self, uchar [::1] buffer) -> int:
+        """
+        Read bytes from the stream directly into a writable buffer, e.g., a
+        preallocated :class:`bytearray` or :class:`numpy.ndarray`.
+
+        Returns
+        -------
+        int
+            Number of bytes written to :data:`buffer`, i.e., up to
+            ``len(buffer)``.
+        """
+        if buffer.shape[0] == 0:
+            return 0
+        return self._read_into(&buffer[0], buffer.shape[0])
+
+    def clear(self):
+        """
+        Discard all unread bytes, releasing queued packets.
+        """
+        while not self.chunks_.empty():
+            self._release_head()
+        self.available = 0
+
+    def __len__(self):
+        return self.available
+
+    property packet_count:
+        def __get__(self):
+            """
+            Number of queued packets with unread bytes.
+            """
+            return self.chunks_.size()
+
+
 def crc_init():
     return c_crc_init()
 
@@ -317,18 +816,268 @@ def crc_finalize(crc):
     return c_crc_finalize(crc)
 
 
-def crc_update(uint16_t crc, uchar [:] data):
-    return c_crc_update(crc, &data[0], len(data))
+def crc_update(uint16_t crc, const uchar [::1] data):
+    """
+    .. versionchanged:: 0.16
+        Accept read-only and empty buffers, and release the GIL while
+        updating the checksum.
+    """
+    cdef size_t length = data.shape[0]
+    cdef const uchar *data_ptr
+
+    if length == 0:
+        return crc
+    data_ptr = &data[0]
+    with nogil:
+        crc = c_crc_update(crc, data_ptr, length)
+    return crc
 
 
 def crc_update_byte(uint16_t crc, uchar octet):
     return c_crc_update_byte(crc, octet)
 
-def compute_crc16(data):
-    cdef string data_ = data
-    cdef uint16_t crc = crc_init()
-    crc = c_crc_update(crc, <uchar *>data_.c_str(), len(data))
-    return crc_finalize(crc)
+def compute_crc16(const uchar [::1] data):
+    """
+    .. versionchanged:: 0.16
+        Compute the checksum in place (i.e., without copying :data:`data`
+        into a ``std::string``), with the GIL released.
+    """
+    cdef size_t length = data.shape[0]
+    cdef const uchar *data_ptr = &data[0] if length > 0 else NULL
+    cdef crc_t crc = c_crc_init()
+
+    with nogil:
+        if length > 0:
+            crc = c_crc_update(crc, data_ptr, length)
+        crc = c_crc_finalize(crc)
+    return crc
+
+cdef size_t _prepare_frames(object packets, vector[FixedPacket] &frames,
+                           list references) except? 0:
+    """
+    Append a packet struct to :data:`frames` for each item in
+    :data:`packets` and return the total serialized size.
+
+    Every object referenced by a packet struct is appended to
+    :data:`references` to keep it alive (and its buffer exported) while the
+    frames are written.  The payload buffer of each :class:`cPacket` is
+    pinned (see :meth:`cPacket.payload_view`) until the references are
+    released using :func:`_release_references`.
+    """
+    cdef FixedPacket frame
+    cdef const uchar [::1] payload
+    cdef size_t size = 0
+
+    for item in packets:
+        if isinstance(item, cPacket):
+            frame = deref((<cPacket>item).thisptr)
+            (<cPacket>item).exports_ += 1
+            references.append(item)
+        else:
+            iuid, type_, data = item
+            frame.iuid_ = iuid
+            frame.type(<uchar>type_)
+            frame.crc_ = 0xFFFF
+            frame.payload_buffer_ = NULL
+            frame.payload_length_ = 0
+            frame.buffer_size_ = 0
+            if data is not None and len(data) > 0:
+                payload = data
+                if payload.shape[0] > 0xFFFF:
+                    raise ValueError(f'Payload is too long, {payload.shape[0]} > {0xFFFF}')
+                references.append(payload)
+                frame.payload_buffer_ = <uchar *>&payload[0]
+                frame.payload_length_ = payload.shape[0]
+                frame.buffer_size_ = payload.shape[0]
+        frames.push_back(frame)
+        size += packet_serialized_size(frame)
+    return size
+
+
+cdef _release_references(list references):
+    """
+    Unpin the payload buffer of each :class:`cPacket` pinned by
+    :func:`_prepare_frames`.
+    """
+    for item in references:
+        if isinstance(item, cPacket):
+            (<cPacket>item).exports_ -= 1
+
+
+cdef size_t _write_frames(uchar *output, vector[FixedPacket] &frames) noexcept nogil:
+    cdef size_t i
+    cdef size_t offset = 0
+
+    for i in range(frames.size()):
+        offset += write_packet_buffer(output + offset, frames[i])
+    return offset
+
+
+def serialize_many(packets) -> bytes:
+    """
+    Serialize several packets into one contiguous :class:`bytes` object.
+
+    All frames are written (including payload copies and CRC computation)
+    in a single pass with the GIL released.
+
+    .. versionadded:: 0.16
+
+    Parameters
+    ----------
+    packets : iterable
+        Each item is either a :class:`cPacket` or an ``(iuid, type_,
+        payload)`` tuple, where ``payload`` is a C-contiguous bytes-like
+        object (or ``None``).
+
+    Returns
+    -------
+    bytes
+        Concatenated serialized packets, i.e., equivalent to
+        ``b''.join(p.tobytes() for p in packets)``.
+    """
+    cdef vector[FixedPacket] frames
+    cdef list references = []
+    cdef size_t size
+    cdef bytes output
+    cdef uchar *output_ptr
+
+    try:
+        size = _prepare_frames(packets, frames, references)
+        output = PyBytes_FromStringAndSize(NULL, size)
+        output_ptr = <uchar *>PyBytes_AS_STRING(output)
+        with nogil:
+            _write_frames(output_ptr, frames)
+    finally:
+        _release_references(references)
+    return output
+
+
+def serialize_many_into(packets, uchar [::1] buffer, Py_ssize_t offset=0) -> int:
+    """
+    Serialize several packets into a writable buffer, e.g., a preallocated
+    :class:`bytearray` (see :func:`serialize_many`).
+
+    .. versionadded:: 0.16
+
+    Parameters
+    ----------
+    packets : iterable
+        See :func:`serialize_many`.
+    buffer : bytearray, memoryview, numpy.ndarray, ...
+        Writable, C-contiguous buffer.
+    offset : int, optional
+        Offset in :data:`buffer` to start writing at.
+
+    Returns
+    -------
+    int
+        Number of bytes written.
+
+    Raises
+    ------
+    ValueError
+        If the packets do not fit in :data:`buffer` at :data:`offset`.
+    """
+    cdef vector[FixedPacket] frames
+    cdef list references = []
+    cdef size_t size
+    cdef uchar *output_ptr
+
+    try:
+        size = _prepare_frames(packets, frames, references)
+        if offset < 0 or offset > buffer.shape[0] or <size_t>(buffer.shape[0] - offset) < size:
+            raise ValueError(f'Packets do not fit in buffer, {size} bytes at offset {offset} > {buffer.shape[0]}')
+        if size == 0:
+            return 0
+        output_ptr = &buffer[0] + offset
+        with nogil:
+            _write_frames(output_ptr, frames)
+    finally:
+        _release_references(references)
+    return size
+
+
+cdef void _crc16_segments(const uchar *data, const Py_ssize_t *offsets,
+                          const Py_ssize_t *lengths, uint16_t *result,
+                          Py_ssize_t start, Py_ssize_t stop) noexcept nogil:
+    cdef Py_ssize_t i
+    cdef crc_t crc
+
+    for i in range(start, stop):
+        crc = c_crc_init()
+        if lengths[i] > 0:
+            crc = c_crc_update(crc, data + offsets[i], lengths[i])
+        result[i] = c_crc_finalize(crc)
+
+
+def _crc16_batch_chunk(const uchar [::1] data, const Py_ssize_t [::1] offsets,
+                       const Py_ssize_t [::1] lengths, uint16_t [::1] result,
+                       Py_ssize_t start, Py_ssize_t stop):
+    cdef const uchar *data_ptr = &data[0] if data.shape[0] > 0 else NULL
+    cdef const Py_ssize_t *offsets_ptr = &offsets[0]
+    cdef const Py_ssize_t *lengths_ptr = &lengths[0]
+    cdef uint16_t *result_ptr = &result[0]
+
+    with nogil:
+        _crc16_segments(data_ptr, offsets_ptr, lengths_ptr, result_ptr, start,
+                        stop)
+
+
+def crc16_batch(data, offsets, lengths, num_threads=1):
+    """
+    Compute the CRC checksum (see :func:`compute_crc16`) of many segments of
+    a byte buffer.
+
+    The checksums are computed with the GIL released.
+
+    .. versionadded:: 0.16
+
+    Parameters
+    ----------
+    data : numpy.ndarray or bytes-like
+        Contiguous ``uint8`` buffer, e.g., a captured log.
+    offsets, lengths : array-like
+        Offset and length of each segment in :data:`data`.
+    num_threads : int, optional
+        Number of threads to split the segments across.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``uint16`` CRC checksum of each segment.
+
+    Raises
+    ------
+    ValueError
+        If any segment is out of bounds of :data:`data`.
+    """
+    data = np.frombuffer(data, dtype='uint8')
+    offsets = np.ascontiguousarray(offsets, dtype=np.intp).ravel()
+    lengths = np.ascontiguousarray(lengths, dtype=np.intp).ravel()
+    if offsets.shape != lengths.shape:
+        raise ValueError(f'Shape of `offsets` and `lengths` must match, {offsets.shape} != {lengths.shape}')
+    result = np.empty(offsets.shape, dtype='uint16')
+    count = result.shape[0]
+    if count == 0:
+        return result
+    # Compare each operand separately, since `offsets + lengths` may overflow.
+    if ((offsets < 0).any() or (lengths < 0).any() or (offsets > data.shape[0]).any() or
+            (lengths > data.shape[0] - offsets).any()):
+        raise ValueError('Segment out of bounds.')
+
+    num_threads = max(1, min(num_threads, count))
+    if num_threads == 1:
+        _crc16_batch_chunk(data, offsets, lengths, result, 0, count)
+    else:
+        bounds = np.linspace(0, count, num_threads + 1).astype(int)
+        with ThreadPoolExecutor(num_threads) as executor:
+            futures = [executor.submit(_crc16_batch_chunk, data, offsets,
+                                       lengths, result, start, stop)
+                       for start, stop in zip(bounds[:-1], bounds[1:])]
+            for future in futures:
+                future.result()
+    return result
+
 
 def byte_pair(value):
     return chr((value >> 8) & 0x0FF), chr(value & 0x0FF)
@@ -340,6 +1089,10 @@ def parse_from_string(packet_str):
         Coerce :data:`packet_str` to :class:`bytes` and do not use :func:`ord`
         to decode characters.  This is required to support both Python 2 and 3.
 
+    .. versionchanged:: 0.16
+        Pass :data:`packet_str` to the parser directly, without building an
+        intermediate list/array.
+
 
     Returns
     -------
@@ -347,7 +1100,7 @@ def parse_from_string(packet_str):
         Parsed packet instance.
     """
     parser = cPacketParser()
-    return parser.parse(np.array([v for v in bytes(packet_str)], dtype='uint8'))
+    return parser.parse(bytes(packet_str))
 
 
 PACKET_NAME_BY_TYPE = {PACKET_TYPE_NONE: 'NONE',
@@ -1,5 +1,8 @@
 # coding: utf-8
 import os
+import queue
+import selectors
+import socket
 import time
 import pint
 import threading
@@ -8,7 +11,7 @@ import numpy as np
 
 from or_event import OrEvent
 from path_helpers import path
-from typing import List, Optional, Callable, Dict
+from typing import List, Optional, Callable, Dict, Iterator
 
 from ._version import get_versions
 
@@ -163,3 +166,242 @@ def read_packet(read_func: Callable, timeout_s: Optional[float] = None, poll_s:
         # Exception occurred while reading/parsing.
         raise parse_error._exception
     return result['response']
+
+
+def read_packets(read_func: Callable, timeout_s: Optional[float] = None, poll_s: float = 0.001,
+                 fileno: Optional[int] = None, **kwargs) -> Iterator['cPacket']:
+    """
+    Read packets continuously from specified callback function.
+
+    A single parser is kept alive for the lifetime of the generator, and
+    every parsed packet is yielded, including packets following another
+    packet in the same read.
+
+    Reading happens lazily in the consuming thread: :data:`read_func` is only
+    called once all packets parsed from the previous read have been
+    consumed.  At most one read is buffered, and unread bytes stay in the
+    underlying stream (i.e., backpressure is applied to the device).
+
+    .. versionadded:: 0.16
+
+    Parameters
+    ----------
+    read_func : function
+        Callback function.  Must return ``bytes``.
+    timeout_s : float, optional
+        Number of seconds to wait for each packet.
+
+        By default, block until a packet is received.
+    poll_s : float, optional
+        Time to wait between calls to :func:`read_func` when :data:`fileno`
+        is not set.
+    fileno : int, optional
+        File descriptor of the underlying stream.  If set, block until the
+        file descriptor is readable rather than polling :data:`read_func`
+        (see :class:`PacketReader`).  The generator stops at the end of the
+        stream.
+    **kwargs
+        Keyword arguments passed to :class:`cPacketParser` (e.g.,
+        ``resync=True``).
+
+    Yields
+    ------
+    cPacket
+        Parsed packet.
+
+    Raises
+    ------
+    RuntimeError
+        If specified time out is reached before the next packet is received.
+    Exception
+        If an exception is encountered while reading or parsing, the exception is raised.
+    """
+    from .NadaMq import cPacketParser
+
+    parser = cPacketParser(**kwargs)
+    selector = None
+    if fileno is not None:
+        selector = selectors.DefaultSelector()
+        selector.register(fileno, selectors.EVENT_READ)
+
+    try:
+        start = time.time()
+        while True:
+            if selector is not None:
+                remaining = None if timeout_s is None else max(0, start + timeout_s - time.time())
+                if selector.select(remaining):
+                    data = read_func()
+                    if not data:
+                        # End of stream.
+                        return
+                else:
+                    data = None
+            else:
+                data = read_func()
+
+            if data:
+                for packet in parser.iter_packets(data):
+                    yield packet
+                    start = time.time()
+            if timeout_s is not None and time.time() - start > timeout_s:
+                timed_out = ureg.Quantity(time.time() - start, ureg.second)
+                raise RuntimeError(f'Timed out waiting for packet (after {timed_out:.1f}).')
+            if not data and selector is None:
+                time.sleep(poll_s)
+    finally:
+        if selector is not None:
+            selector.close()
+
+
+class PacketReader:
+    """
+    Read packets from a stream using a single, persistent parser and reader
+    thread.
+
+    Unlike :func:`read_packet`, which creates a new thread and parser for
+    every packet, a reader is created once per stream.  Every parsed packet
+    is delivered to :meth:`read_packet` callers through a queue, so bytes
+    following a packet in the same read are not lost.
+
+    .. versionadded:: 0.16
+
+    Parameters
+    ----------
+    read_func : function
+        Callback function.  Must return ``bytes``.
+    fileno : int, optional
+        File descriptor of the underlying stream (e.g., a pipe, a socket, or
+        ``serial.Serial.fileno()`` on POSIX).
+
+        If set, the reader thread blocks until the file descriptor is
+        readable (using :mod:`selectors`), rather than polling
+        :data:`read_func`.  An empty read from a readable file descriptor is
+        treated as the end of the stream.
+    poll_s : float, optional
+        Time to wait between calls to :func:`read_func` when :data:`fileno`
+        is not set.
+    **kwargs
+        Keyword arguments passed to :class:`cPacketParser` (e.g.,
+        ``resync=True``).
+
+    Examples
+    --------
+
+    >>> with PacketReader(lambda: os.read(fd, 4096), fileno=fd) as reader:
+    ...     packet = reader.read_packet(timeout_s=1.)
+    """
+
+    def __init__(self, read_func: Callable, fileno: Optional[int] = None, poll_s: float = 0.001,
+                 **kwargs) -> None:
+        from .NadaMq import cPacketParser
+
+        self._read_func = read_func
+        self._fileno = fileno
+        self._poll_s = poll_s
+        self.parser = cPacketParser(**kwargs)
+        self._packets = queue.Queue()
+        self._stop_request = threading.Event()
+        # Socket pair used to wake the reader thread from `select` on close.
+        self._wakeup = socket.socketpair() if fileno is not None else None
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _read_chunks(self):
+        """
+        Yield chunks of data from :attr:`_read_func` until a stop is
+        requested.
+        """
+        if self._fileno is None:
+            while not self._stop_request.is_set():
+                data = self._read_func()
+                if data:
+                    yield data
+                else:
+                    self._stop_request.wait(self._poll_s)
+            return
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._fileno, selectors.EVENT_READ)
+            selector.register(self._wakeup[0], selectors.EVENT_READ)
+            while not self._stop_request.is_set():
+                for key, events in selector.select():
+                    if key.fileobj is self._wakeup[0] or self._stop_request.is_set():
+                        return
+                    data = self._read_func()
+                    if not data:
+                        raise EOFError('End of stream.')
+                    yield data
+
+    def _run(self) -> None:
+        try:
+            for data in self._read_chunks():
+                for packet in self.parser.iter_packets(data):
+                    self._packets.put(packet)
+        except Exception as exception:
+            # Exception occurred while reading/parsing.
+            # Store exception and report to calling thread(s).
+            self._packets.put(exception)
+
+    def read_packet(self, timeout_s: Optional[float] = None) -> 'cPacket':
+        """
+        Read next packet.
+
+        Blocks until a packet is available (or exception occurs).
+
+        Parameters
+        ----------
+        timeout_s : float, optional
+            Number of seconds to wait for a packet.
+
+            By default, block until a packet is received.
+
+        Returns
+        -------
+        cPacket
+            Parsed packet.
+
+        Raises
+        ------
+        RuntimeError
+            If specified time out is reached before a packet is received.
+        Exception
+            If an exception was encountered while reading or parsing (or
+            :class:`EOFError` if the reader is closed), the exception is
+            raised.
+        """
+        start = time.time()
+        try:
+            result = self._packets.get(timeout=timeout_s)
+        except queue.Empty:
+            timed_out = ureg.Quantity(time.time() - start, ureg.second)
+            raise RuntimeError(f'Timed out waiting for packet (after {timed_out:.1f}).')
+        if isinstance(result, Exception):
+            # Leave exception in queue to report it to any other waiters.
+            self._packets.put(result)
+            raise result
+        return result
+
+    def close(self) -> None:
+        """
+        Stop reader thread.
+
+        Packets that were already parsed may still be read.  After that,
+        :meth:`read_packet` raises :class:`EOFError`.
+        """
+        if self._stop_request.is_set():
+            return
+        self._stop_request.set()
+        if self._wakeup is not None:
+            self._wakeup[1].send(b'\0')
+        self._thread.join()
+        if self._wakeup is not None:
+            for socket_ in self._wakeup:
+                socket_.close()
+        self._packets.put(EOFError('Reader closed.'))
+
+    def __enter__(self) -> 'PacketReader':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
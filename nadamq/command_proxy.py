@@ -1,25 +1,73 @@
 # coding: utf-8
+import asyncio
+import errno
+import functools
+import os
 import re
+import selectors
+import socket
+import threading
 import time
 import serial
 
 import numpy as np
 
-from datetime import datetime
+from concurrent.futures import Future
 from pprint import pformat
-from typing import Dict, Callable, List, Any, Tuple
+from typing import Dict, Callable, Iterable, List, Any, Optional, Tuple
 
-from nadamq.NadaMq import (cPacket, PACKET_TYPES, cPacketParser)
+from nadamq.NadaMq import (cPacket, PACKET_TYPES, cPacketParser, serialize_many)
+from nadamq.packet_protocol import PacketProtocol
 
 
+@functools.lru_cache(maxsize=None)
 def camelcase_to_underscore(value: str) -> str:
     """
     Function to convert from camel-case to underscore separated.
     Taken from https://djangosnippets.org/snippets/585/
+
+    .. versionchanged:: 0.16
+        Cache results, since the same command names are converted for every
+        proxy instance.
     """
     return re.sub('(((?<=[a-z])[A-Z])|([A-Z](?![A-Z]|$)))', '_\\1', value).lower().strip('_')
 
 
+@functools.lru_cache(maxsize=None)
+def _request_fields(request_types: Tuple[Tuple[str, Callable], ...]) -> Dict[str, Tuple[str, Callable]]:
+    """
+    Map each request name to the corresponding union request field name and
+    request message class.
+
+    Cached for managers sharing the same Protocol buffer module.
+
+    .. versionadded:: 0.16
+    """
+    return {name: (camelcase_to_underscore(name), request_type)
+            for name, request_type in request_types}
+
+
+@functools.lru_cache(maxsize=None)
+def _response_decoders(response_class: Callable) -> Dict[int, Callable]:
+    """
+    Map the number of each (non-repeated) message field of the union
+    response class to the decoder of the corresponding message class.
+
+    Cached for managers sharing the same Protocol buffer module.
+
+    .. versionadded:: 0.16
+    """
+    response = response_class()
+    decoders = {}
+    for field in response_class.DESCRIPTOR.fields:
+        if field.type == field.TYPE_MESSAGE:
+            value = getattr(response, field.name)
+            # Repeated fields are containers, which have no decoder.
+            if hasattr(value, 'FromString'):
+                decoders[field.number] = type(value).FromString
+    return decoders
+
+
 class CommandRequestManagerBase:
     """
     This class acts as a factory for creating Protocol buffer command request
@@ -91,6 +139,11 @@ class CommandRequestManagerBase:
 
     The `command_type_class` argument must be the Python Protocol buffer
     enumerated command type class _(e.g., `CommandType`)_.
+
+    .. versionchanged:: 0.16
+        Request field names and response decoders are looked up in tables
+        computed once (and shared by managers using the same Protocol buffer
+        module), rather than on every request/response.
     """
 
     def __init__(self, request_types: Dict,
@@ -101,6 +154,8 @@ class CommandRequestManagerBase:
         self.request_class = request_class
         self.response_class = response_class
         self.command_type_class = command_type_class
+        self._request_fields = _request_fields(tuple(request_types.items()))
+        self._response_decoders = _response_decoders(response_class)
 
     @property
     def command_names(self) -> List[str]:
@@ -118,15 +173,22 @@ class CommandRequestManagerBase:
         buffer message class constructor, allowing initial values to be set on
         the message.
         """
-        lowercase = camelcase_to_underscore(request_type_name)
-        command_kwargs = {lowercase: self.request_types[request_type_name](**kwargs)}
-        return self.request_class(**command_kwargs).SerializeToString()
+        field_name, request_type = self._request_fields[request_type_name]
+        return self.request_class(**{field_name: request_type(**kwargs)}).SerializeToString()
 
     def response(self, byte_data: bytes) -> Any:
         """
         Return a Protocol Buffer response object deserialized from the provided
         string of encoded message bytes.
         """
+        # Fast path: if the encoded response consists of a single message
+        # field with a one byte tag and length (i.e., field number < 16 and
+        # sub-response < 128 bytes), decode the sub-response directly.
+        if len(byte_data) >= 2 and byte_data[0] & 0x87 == 2 and byte_data[1] < 0x80 \
+                and byte_data[1] + 2 == len(byte_data):
+            decoder = self._response_decoders.get(byte_data[0] >> 3)
+            if decoder is not None:
+                return decoder(byte_data[2:])
         response = self.response_class.FromString(byte_data)
         sub_response = response.ListFields()[0][1]
         return sub_response
@@ -173,6 +235,38 @@ class CommandRequestManager(CommandRequestManagerBase):
         return getattr(sub_response, 'result', sub_response)
 
 
+def _decode_response(command_request_manager: CommandRequestManagerBase,
+                     command_name: str, response_packet: cPacket) -> Any:
+    """
+    Decode response packet to a request of the specified command type.
+
+    .. versionadded:: 0.16
+    """
+    if response_packet.type_ == PACKET_TYPES.DATA:
+        if command_name == 'ForwardI2cRequest':
+            # This was a forwarded request, so we must return the undecoded
+            # response data, since decoding is the responsibility of the
+            # calling code.
+            return response_packet.data()
+        else:
+            return command_request_manager.response(response_packet.data())
+    else:
+        raise ValueError(f'Invalid response. ({response_packet.type_}).\n"{pformat(response_packet.tobytes())}"')
+
+
+def _next_iuid(iuid: int, pending: Dict[int, Any]) -> int:
+    """
+    Return the `iuid` following :data:`iuid`, skipping `iuid` 0 (the
+    stop-and-wait default) and any `iuid` still pending after wrapping around.
+
+    .. versionadded:: 0.16
+    """
+    while True:
+        iuid = iuid % 0xFFFF + 1
+        if iuid not in pending:
+            return iuid
+
+
 class NodeProxy:
     """
     This class uses a command request manager to automatically populate methods
@@ -204,16 +298,59 @@ class NodeProxy:
       - `read(count=None)`: Read the specified number of bytes from the stream.
         If `count` is `None`, read as many bytes as are currently available.
       - `write(data)`: Write the specified data to the stream.
+
+    ## `max_in_flight` ##
+
+    By default, each request is stop-and-wait, i.e., the stream is flushed,
+    the request is written, and the response is read before returning.
+
+    If `max_in_flight` is set, requests are _pipelined_: each request is sent
+    with a monotonically increasing `iuid`, up to `max_in_flight` requests may
+    be awaiting a response at once, and a background thread matches each
+    response to the pending request with the same `iuid`.  Use :meth:`submit`
+    to send a request without waiting for the response, e.g.:
+
+        futures = [proxy.submit('MyCommandA', value=i) for i in range(100)]
+        results = [f.result() for f in futures]
+
+    .. versionchanged:: 0.16
+        Add `max_in_flight` argument to enable request pipelining.
     """
 
     def __init__(self, command_request_manager: CommandRequestManagerBase,
-                 stream: 'Stream', timeout: float = None) -> None:
+                 stream: 'Stream', timeout: float = None,
+                 max_in_flight: Optional[int] = None) -> None:
         timeout = 1.5 if timeout is None else timeout
         self._timeout = timeout
         self._stream = stream
         self._command_request_manager = command_request_manager
+        self._max_in_flight = max_in_flight
+        # Parser reused for every response.
+        self._parser = cPacketParser()
+        self._receive_thread = None
+        self._closed = threading.Event()
+        # Cleared if the stream does not support `read(timeout=...)`.
+        self._blocking_read = True
+        if max_in_flight is not None:
+            self._iuid = 0
+            # Future, command name, and deadline of each pending request,
+            # keyed by `iuid`.
+            self._pending: Dict[int, Tuple[Future, str, float]] = {}
+            self._pending_lock = threading.Lock()
+            self._in_flight = threading.BoundedSemaphore(max_in_flight)
+            # Set while requests are pending (or the proxy is closed), so the
+            # receiver thread blocks while idle.
+            self._wake_receiver = threading.Event()
+            self._receive_thread = threading.Thread(target=self._receive_responses, daemon=True)
+            self._receive_thread.start()
         self._initialize_methods()
 
+    def __enter__(self) -> 'NodeProxy':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
     def _do_request(self, name: str) -> Callable:
         """
         Note that we need to use [partial function application][1]
@@ -238,6 +375,8 @@ class NodeProxy:
                             (address=remote_address, request=request))
 
                 command_func = _remote_func
+            elif self._max_in_flight is not None:
+                command_func = (lambda **kwargs: self.submit(name, **kwargs).result())
             else:
                 command_func = (lambda **kwargs: self._do_request_from_command_name(name, **kwargs))
             for i in range(retry_count):
@@ -273,43 +412,390 @@ class NodeProxy:
 
     def _do_request_from_command_name(self, command_name: str,
                                       iuid: int = 0, **kwargs: Any) -> Any:
+        """
+        .. versionchanged:: 0.16
+            Feed bytes read from the stream directly to a parser reused across
+            requests (rather than creating a new parser and converting each
+            chunk to a list of ordinals).
+        """
         request = self._command_request_manager.request(command_name, **kwargs)
         packet = cPacket(iuid=iuid, type_=PACKET_TYPES.DATA, data=request)
         # Flush any remaining bytes from stream.
         self._stream.read()
+        self._parser.reset()
         # Write request packet to stream.
         self._stream.write(packet.tostring())
-        parser = cPacketParser()
-        data = np.array([ord(v) for v in self._stream.read()], dtype='uint8')
-        start = datetime.now()
-        wait_counts = 0
-        response_packet = None
-        try:
-            result = parser.parse(data)
-            while not result:
-                data = np.array([ord(v) for v in self._stream.read()], dtype='uint8')
-                result = parser.parse(data)
-                if (datetime.now() - start).total_seconds() > self._timeout:
-                    raise ValueError(f'Timeout while waiting for packet.\n"{pformat(data.tostring())}"')
-                if not result:
-                    time.sleep(0.0001)
-                    wait_counts += 1
-                else:
-                    response_packet = result
+        start = time.time()
+        while True:
+            # Check timeout on every pass, since a device sending unrelated
+            # bytes may never leave the stream empty.
+            remaining = start + self._timeout - time.time()
+            if remaining < 0:
+                raise ValueError('Timeout while waiting for packet.')
+            data = self._read_stream(remaining)
+            if data:
+                try:
+                    response_packet = self._parser.parse(data)
+                except RuntimeError:
+                    raise ValueError(f'Error parsing response packet.\n"{pformat(data)}"')
+                if response_packet:
                     break
-        except RuntimeError:
-            raise ValueError(f'Error parsing response packet.\n"{pformat(data.tostring())}"')
-        if response_packet.type_ == PACKET_TYPES.DATA:
-            if command_name == 'ForwardI2cRequest':
-                # This was a forwarded request, so we must return the undecoded
-                # response data, since decoding is the responsibility of the
-                # calling code.
-                return response_packet.data()
-            else:
-                return (self._command_request_manager
-                        .response(response_packet.data()))
-        else:
-            raise ValueError(f'Invalid response. ({response_packet.type_}).\n"{pformat(data)}"')
+        return _decode_response(self._command_request_manager, command_name, response_packet)
+
+    def submit(self, command_name: str, **kwargs: Any) -> Future:
+        """
+        Send request without waiting for the response (pipelined mode only).
+
+        .. versionadded:: 0.16
+
+        Parameters
+        ----------
+        command_name : str
+            Camel-case command name _(e.g., `'MyCommandA'`)_.
+        **kwargs
+            Keyword arguments passed to the command request manager.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolved with the decoded response.  Fails with a
+            :class:`ValueError` if no response is received within the proxy
+            timeout.
+
+        Raises
+        ------
+        RuntimeError
+            If pipelining is not enabled (see `max_in_flight`), or if the
+            proxy is closed.
+        ValueError
+            If `max_in_flight` requests are still pending after the proxy
+            timeout.
+        """
+        if self._max_in_flight is None:
+            raise RuntimeError('Pipelining is not enabled (see `max_in_flight`).')
+        elif self._closed.is_set():
+            raise RuntimeError('Proxy is closed.')
+        request = self._command_request_manager.request(command_name, **kwargs)
+        return self._submit_encoded([(command_name, request)])[0]
+
+    def _submit_encoded(self, requests: List[Tuple[str, bytes]]) -> List[Future]:
+        """
+        Send encoded requests in a single write (pipelined mode only).
+
+        At most `max_in_flight` requests may be submitted at once.
+        """
+        for i in range(len(requests)):
+            if not self._in_flight.acquire(timeout=self._timeout):
+                for _ in range(i):
+                    self._in_flight.release()
+                raise ValueError(f'Timeout while waiting for one of {self._max_in_flight} pending requests.')
+        futures = []
+        packets = []
+        deadline = time.time() + self._timeout
+        with self._pending_lock:
+            for command_name, request in requests:
+                future = Future()
+                future.set_running_or_notify_cancel()
+                future.add_done_callback(lambda future: self._in_flight.release())
+                self._iuid = _next_iuid(self._iuid, self._pending)
+                self._pending[self._iuid] = future, command_name, deadline
+                futures.append(future)
+                packets.append((self._iuid, PACKET_TYPES.DATA, request))
+            self._wake_receiver.set()
+            # Write while holding lock so `iuid` values are sent in order.
+            self._stream.write(serialize_many(packets))
+        return futures
+
+    def call_many(self, requests: Iterable[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Encode several requests, write them to the stream in a single write,
+        and collect all responses.
+
+        For example, to set the state of 50 channels:
+
+            proxy.call_many([('SetChannelState', {'channel': i, 'state': 1})
+                             for i in range(50)])
+
+        In pipelined mode (see `max_in_flight`), requests are written in
+        chunks of at most `max_in_flight` requests.
+
+        .. versionadded:: 0.16
+
+        Parameters
+        ----------
+        requests : iterable
+            Camel-case command name _(e.g., `'MyCommandA'`)_ and keyword
+            arguments of each request.
+
+        Returns
+        -------
+        list
+            Decoded response to each request, in request order.
+
+        Raises
+        ------
+        ValueError
+            If a response is not received before the proxy timeout, or a
+            response cannot be parsed.
+        """
+        requests = [(command_name, self._command_request_manager.request(command_name, **kwargs))
+                    for command_name, kwargs in requests]
+        if self._max_in_flight is not None:
+            if self._closed.is_set():
+                raise RuntimeError('Proxy is closed.')
+            futures = []
+            for i in range(0, len(requests), self._max_in_flight):
+                futures.extend(self._submit_encoded(requests[i:i + self._max_in_flight]))
+            return [future.result() for future in futures]
+        elif not requests:
+            return []
+        elif len(requests) > 0xFFFF:
+            raise ValueError(f'At most {0xFFFF} requests may be sent at once.')
+
+        # Flush any remaining bytes from stream.
+        self._stream.read()
+        # Write all request packets, using `iuid` values 1..N.
+        self._stream.write(serialize_many([(i + 1, PACKET_TYPES.DATA, request)
+                                           for i, (_, request) in enumerate(requests)]))
+        responses = self._read_responses(len(requests))
+        return [_decode_response(self._command_request_manager, command_name, responses[i + 1])
+                for i, (command_name, _) in enumerate(requests)]
+
+    def _read_responses(self, count: int) -> Dict[int, cPacket]:
+        """
+        Read responses to requests with `iuid` values 1..:data:`count`.
+
+        Returns
+        -------
+        dict
+            Response packets, keyed by `iuid`.
+        """
+        self._parser.reset()
+        responses = {}
+        start = time.time()
+        while len(responses) < count:
+            # Check timeout on every pass, since a device sending unrelated
+            # packets may never leave the stream empty.
+            remaining = start + self._timeout - time.time()
+            if remaining < 0:
+                raise ValueError(f'Timeout while waiting for packet ({count - len(responses)} of {count} '
+                                 'responses not received).')
+            data = self._read_stream(remaining)
+            if data:
+                try:
+                    for packet in self._parser.iter_packets(data):
+                        if 1 <= packet.iuid <= count:
+                            responses[packet.iuid] = packet
+                except RuntimeError:
+                    raise ValueError(f'Error parsing response packet.\n"{pformat(data)}"')
+        return responses
+
+    def _read_stream(self, timeout: float) -> bytes:
+        """
+        Read available response bytes, waiting up to :data:`timeout` seconds
+        for bytes to arrive.
+
+        Block in `read(timeout=...)` if supported by the stream.  Streams
+        which do not support a read timeout _(e.g., `SerialStream` in
+        unbuffered mode)_ are polled instead.
+
+        Returns
+        -------
+        bytes
+            Bytes read, or empty if no bytes were available.
+        """
+        if self._blocking_read:
+            try:
+                return self._stream.read(timeout=max(timeout, 0.0001))
+            except TypeError:
+                # Stream does not support `timeout` argument.
+                self._blocking_read = False
+            except ValueError as exception:
+                if str(exception).startswith('Timeout'):
+                    return b''
+                # Stream does not support `timeout` argument in current mode.
+                self._blocking_read = False
+            except EOFError:
+                # Stream closed; wait for the caller's timeout to expire.
+                self._closed.wait(min(timeout, 0.05))
+                return b''
+        data = self._stream.read()
+        if not data:
+            self._closed.wait(0.0001)
+        return data
+
+    def _receive_responses(self) -> None:
+        """
+        Resolve pending request futures as response packets are received, and
+        fail requests whose response is not received before their deadline.
+
+        The thread blocks while no requests are pending (see also
+        :meth:`_read_stream`).
+        """
+        while not self._closed.is_set():
+            with self._pending_lock:
+                if not self._pending:
+                    self._wake_receiver.clear()
+            self._wake_receiver.wait()
+            if self._closed.is_set():
+                break
+            # Wait until the earliest request deadline (or at most 50 ms, to
+            # notice when the proxy is closed).
+            with self._pending_lock:
+                deadline = min((deadline for _, _, deadline in self._pending.values()), default=0)
+            data = self._read_stream(min(deadline - time.time(), 0.05))
+            if data:
+                try:
+                    packets = self._parser.parse_all(data)
+                except RuntimeError:
+                    # Corrupt response(s); the corresponding requests will time out.
+                    self._parser.reset()
+                    packets = []
+                for packet in packets:
+                    with self._pending_lock:
+                        pending = self._pending.pop(packet.iuid, None)
+                    if pending is None:
+                        # Unsolicited packet, or response after time out.
+                        continue
+                    future, command_name, _ = pending
+                    try:
+                        future.set_result(_decode_response(self._command_request_manager, command_name, packet))
+                    except Exception as exception:
+                        future.set_exception(exception)
+            if self._pending:
+                now = time.time()
+                with self._pending_lock:
+                    expired = [(iuid, self._pending.pop(iuid)[0])
+                               for iuid, (_, _, deadline) in list(self._pending.items()) if deadline < now]
+                for iuid, future in expired:
+                    future.set_exception(ValueError(f'Timeout while waiting for packet (iuid={iuid}).'))
+
+    def close(self) -> None:
+        """
+        Stop receiving responses (pipelined mode) and fail pending requests.
+
+        .. versionadded:: 0.16
+        """
+        if self._receive_thread is None:
+            return
+        self._closed.set()
+        self._wake_receiver.set()
+        self._receive_thread.join()
+        with self._pending_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future, _, _ in pending:
+            future.set_exception(EOFError('Proxy closed.'))
+
+
+class AsyncNodeProxy:
+    """
+    Asynchronous counterpart of :class:`NodeProxy`, where each generated
+    method _(e.g., `my_command_a(**kwargs)`)_ is a coroutine which awaits the
+    response to the request.
+
+    Each request is sent with a unique `iuid` and each response is matched to
+    the pending request with the same `iuid`, so any number of requests may be
+    outstanding at once, e.g.:
+
+        results = await asyncio.gather(proxy.my_command_a(),
+                                       proxy.my_command_b())
+
+    .. versionadded:: 0.16
+
+    # Requirements #
+
+    ## `command_request_mananger` ##
+
+    See :class:`NodeProxy`.
+
+    ## `protocol` ##
+
+    A connected :class:`nadamq.packet_protocol.PacketProtocol` instance.  The
+    proxy is the only receiver of packets from the protocol.
+    """
+
+    def __init__(self, command_request_manager: CommandRequestManagerBase,
+                 protocol: PacketProtocol, timeout: float = None) -> None:
+        timeout = 1.5 if timeout is None else timeout
+        self._timeout = timeout
+        self._protocol = protocol
+        self._command_request_manager = command_request_manager
+        self._iuid = 0
+        # Futures of pending requests, keyed by `iuid`.
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._receive_task = None
+        self._initialize_methods()
+
+    def _do_request(self, name: str) -> Callable:
+        """
+        See :meth:`NodeProxy._do_request`.
+        """
+
+        async def f(**kwargs):
+            # Retries are not supported, but accept `retry_count` for
+            # compatibility with `NodeProxy`.
+            kwargs.pop('retry_count', None)
+            remote_address = kwargs.pop('remote_address', None)
+            if remote_address is not None:
+                request = self._command_request_manager.request(name, **kwargs)
+                return await (getattr(self, 'forward_i2c_request')
+                              (address=remote_address, request=request))
+            return await self._do_request_from_command_name(name, **kwargs)
+
+        return f
+
+    def _initialize_methods(self) -> None:
+        """
+        See :meth:`NodeProxy._initialize_methods`.
+        """
+        for command_name in self._command_request_manager.command_names:
+            method_name = camelcase_to_underscore(command_name)
+            setattr(self, method_name, self._do_request(command_name))
+
+    async def _receive_responses(self) -> None:
+        """
+        Resolve pending request futures as response packets are received.
+        """
+        while True:
+            try:
+                packet = await self._protocol.recv_packet()
+            except RuntimeError:
+                # Parse error; the corresponding request will time out.
+                continue
+            except Exception as exception:
+                # Connection closed; fail all pending requests.
+                for future in self._pending.values():
+                    if not future.done():
+                        future.set_exception(exception)
+                return
+            future = self._pending.get(packet.iuid)
+            if future is not None and not future.done():
+                future.set_result(packet)
+
+    async def _do_request_from_command_name(self, command_name: str, **kwargs: Any) -> Any:
+        request = self._command_request_manager.request(command_name, **kwargs)
+        iuid = self._iuid = _next_iuid(self._iuid, self._pending)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[iuid] = future
+        if self._receive_task is None or self._receive_task.done():
+            self._receive_task = asyncio.ensure_future(self._receive_responses())
+        try:
+            await self._protocol.send_packet(cPacket(iuid=iuid, type_=PACKET_TYPES.DATA, data=request))
+            response_packet = await asyncio.wait_for(future, self._timeout)
+        except asyncio.TimeoutError:
+            raise ValueError(f'Timeout while waiting for packet (iuid={iuid}).')
+        finally:
+            del self._pending[iuid]
+        return _decode_response(self._command_request_manager, command_name, response_packet)
+
+    def close(self) -> None:
+        """
+        Stop receiving responses and close the protocol transport(s).
+        """
+        if self._receive_task is not None:
+            self._receive_task.cancel()
+        self._protocol.close()
 
 
 class Stream:
@@ -324,23 +810,128 @@ class Stream:
        If `count` is `None`, read as many bytes as are currently available.
      - `write(data)`: Write the specified data to the stream.
 
-    # TODO #
+    Streams may optionally support a `timeout` argument for `read` _(e.g.,
+    `SerialStream` in buffered mode)_, which, when set, blocks until the
+    specified number of bytes is available and raises a `ValueError` if the
+    bytes are not read after the specified timeout.
 
-     - Add `timeout` option for `read` method, which, when set, raises an
-       exception if the specified number of bytes is not read after the
-       specified timeout.
+    .. versionchanged:: 0.16
+        Add optional `timeout` argument to `read`.
     """
 
     def available(self) -> int:
         raise NotImplementedError
 
-    def read(self, count: int = None) -> bytes:
+    def read(self, count: int = None, timeout: float = None) -> bytes:
         raise NotImplementedError
 
     def write(self, data: bytes) -> None:
         raise NotImplementedError
 
 
+class ByteRingBuffer:
+    """
+    Fixed capacity, thread-safe byte FIFO, where readers and writers block on
+    a condition (rather than polling) until data or space is available.
+
+    .. versionadded:: 0.16
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Buffer capacity in bytes.
+    """
+
+    def __init__(self, capacity: int = 1 << 16) -> None:
+        self._buffer = bytearray(capacity)
+        self._start = 0
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        """
+        Close buffer, waking any blocked readers and writers.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def write(self, data: bytes) -> None:
+        """
+        Append :data:`data`, blocking while the buffer is full.
+
+        Data written after the buffer is closed is discarded.
+        """
+        data = memoryview(data)
+        with self._condition:
+            while data and not self._closed:
+                self._condition.wait_for(lambda: self._size < self.capacity or self._closed)
+                if self._closed:
+                    break
+                end = (self._start + self._size) % self.capacity
+                # Copy up to the end of the buffer (i.e., without wrapping).
+                count = min(len(data), self.capacity - self._size, self.capacity - end)
+                self._buffer[end:end + count] = data[:count]
+                self._size += count
+                data = data[count:]
+                self._condition.notify_all()
+
+    def read(self, count: int = None, timeout: float = None) -> bytes:
+        """
+        Read bytes from buffer.
+
+        Parameters
+        ----------
+        count : int, optional
+            Maximum number of bytes to read.  By default, read all available
+            bytes.
+        timeout : float, optional
+            If set, wait up to :data:`timeout` seconds until :data:`count`
+            bytes (or, if :data:`count` is `None`, any bytes) are available.
+
+        Raises
+        ------
+        ValueError
+            If :data:`timeout` is reached before the requested bytes are
+            available (no bytes are consumed).
+        EOFError
+            If the buffer is closed before the requested bytes are available.
+        """
+        with self._condition:
+            if timeout is not None:
+                required = 1 if count is None else count
+                if required > self.capacity:
+                    raise ValueError(f'Cannot wait for more than buffer capacity ({self.capacity} bytes).')
+                if not self._condition.wait_for(lambda: self._size >= required or self._closed,
+                                                timeout):
+                    raise ValueError(f'Timeout while waiting for {required} bytes ({self._size} '
+                                     'available).')
+                elif self._size < required:
+                    raise EOFError('Stream closed.')
+            count = self._size if count is None else min(count, self._size)
+            end = self._start + count
+            if end <= self.capacity:
+                data = bytes(self._buffer[self._start:end])
+            else:
+                data = bytes(self._buffer[self._start:]) + bytes(self._buffer[:end - self.capacity])
+            self._start = end % self.capacity
+            self._size -= count
+            self._condition.notify_all()
+            return data
+
+
 class SerialStream:
     """
     This class provides an adapter around the `serial.Serial` class to expose
@@ -348,29 +939,77 @@ class SerialStream:
 
      - Methods:
       - `available()`: Return the number of bytes available for reading.
-      - `read(count=None)`: Read the specified number of bytes from the stream.
-        If `count` is `None`, read as many bytes as are currently available.
+      - `read(count=None, timeout=None)`: Read the specified number of bytes
+        from the stream.  If `count` is `None`, read as many bytes as are
+        currently available.  `timeout` is only supported in buffered mode.
       - `write(data)`: Write the specified data to the stream.
+
+    In buffered mode (i.e., `buffered=True`), a background thread blocks on
+    the serial port and appends incoming bytes to a `ByteRingBuffer` of
+    `buffer_size` bytes, from which `available()` and `read()` are served
+    without any system calls.
+
+    .. versionchanged:: 0.16
+        Add `buffered` mode, `read(..., timeout=...)`, and `close()`.
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(self, *args: Any, buffered: bool = False,
+                 buffer_size: int = 1 << 16, **kwargs: Any) -> None:
         self._serial = None
+        self._buffer = None
+        self._reader_thread = None
         self._args = args
         self._kwargs = kwargs
+        self._buffered = buffered
+        self._buffer_size = buffer_size
         self.reconnect()
 
     def reconnect(self) -> None:
-        if self._serial is not None:
-            self._serial.close()
+        self.close()
         self._serial = serial.Serial(*self._args, **self._kwargs)
+        if self._buffered:
+            # Bound time blocked in each read, to periodically check whether
+            # the stream has been closed.
+            self._serial.timeout = .05
+            self._buffer = ByteRingBuffer(self._buffer_size)
+            self._reader_thread = threading.Thread(target=self._read_forever,
+                                                   args=(self._serial, self._buffer), daemon=True)
+            self._reader_thread.start()
         time.sleep(.05)
         # Flush welcome message.
         print(self.read())
 
+    def _read_forever(self, serial_: serial.Serial, buffer_: ByteRingBuffer) -> None:
+        try:
+            while not buffer_.closed:
+                # Block until at least one byte is received (or time out).
+                data = serial_.read(serial_.in_waiting or 1)
+                if data:
+                    buffer_.write(data)
+        except serial.SerialException:
+            pass
+        finally:
+            buffer_.close()
+
+    def close(self) -> None:
+        if self._buffer is not None:
+            self._buffer.close()
+            self._reader_thread.join()
+            self._buffer = self._reader_thread = None
+        if self._serial is not None:
+            self._serial.close()
+            self._serial = None
+
     def available(self) -> int:
+        if self._buffered:
+            return len(self._buffer)
         return self._serial.inWaiting()
 
-    def read(self, count: int = None) -> bytes:
+    def read(self, count: int = None, timeout: float = None) -> bytes:
+        if self._buffered:
+            return self._buffer.read(count, timeout)
+        elif timeout is not None:
+            raise ValueError('`timeout` is only supported in buffered mode.')
         if count is None:
             count = self.available()
         else:
@@ -381,6 +1020,199 @@ class SerialStream:
         self._serial.write(data)
 
 
+class _NonBlockingStream(Stream):
+    """
+    Base class for streams over a non-blocking file descriptor.
+
+    Bytes are read from the file descriptor into an internal buffer without
+    blocking, except for `read(..., timeout=...)` which waits on a selector
+    until the requested bytes are available.
+
+    .. versionadded:: 0.16
+    """
+
+    def __init__(self) -> None:
+        self._pending = bytearray()
+        self._read_selector = selectors.DefaultSelector()
+        self._read_selector.register(self.fileno(), selectors.EVENT_READ)
+        self._write_selector = selectors.DefaultSelector()
+        self._write_selector.register(self.fileno(), selectors.EVENT_WRITE)
+
+    def fileno(self) -> int:
+        raise NotImplementedError
+
+    def _recv(self, count: int) -> bytes:
+        """
+        Returns
+        -------
+        bytes
+            Up to :data:`count` bytes, or empty if no bytes are available (or
+            at end of file).
+        """
+        raise NotImplementedError
+
+    def _send(self, data: memoryview) -> int:
+        raise NotImplementedError
+
+    def _fill(self) -> None:
+        while True:
+            data = self._recv(1 << 16)
+            if not data:
+                break
+            self._pending += data
+
+    def available(self) -> int:
+        self._fill()
+        return len(self._pending)
+
+    def read(self, count: int = None, timeout: float = None) -> bytes:
+        self._fill()
+        if timeout is not None:
+            required = 1 if count is None else count
+            deadline = time.time() + timeout
+            while len(self._pending) < required:
+                remaining = deadline - time.time()
+                if remaining <= 0 or not self._read_selector.select(remaining):
+                    raise ValueError(f'Timeout while waiting for {required} bytes ({len(self._pending)} '
+                                     'available).')
+                data = self._recv(1 << 16)
+                if not data:
+                    # Readable, but no data, i.e., end of file.
+                    raise EOFError('Stream closed.')
+                self._pending += data
+        count = len(self._pending) if count is None else min(count, len(self._pending))
+        data = bytes(self._pending[:count])
+        del self._pending[:count]
+        return data
+
+    def write(self, data: bytes) -> None:
+        data = memoryview(data)
+        while data:
+            try:
+                data = data[self._send(data):]
+            except BlockingIOError:
+                pass
+            if data:
+                self._write_selector.select()
+
+    def close(self) -> None:
+        self._read_selector.close()
+        self._write_selector.close()
+
+
+class SocketStream(_NonBlockingStream):
+    """
+    Stream over a connected TCP or Unix domain socket, e.g., to a device
+    behind a serial-to-TCP bridge.
+
+    .. versionadded:: 0.16
+
+    Parameters
+    ----------
+    address : tuple or str, optional
+        `(host, port)` of TCP server, or path of Unix domain socket.
+    sock : socket.socket, optional
+        Connected socket (instead of :data:`address`).
+    """
+
+    def __init__(self, address: Any = None, sock: socket.socket = None) -> None:
+        if sock is None:
+            if isinstance(address, str):
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.connect(address)
+            else:
+                sock = socket.create_connection(address)
+        if sock.family in (socket.AF_INET, socket.AF_INET6):
+            # Send each request immediately.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setblocking(False)
+        self._socket = sock
+        super(SocketStream, self).__init__()
+
+    def fileno(self) -> int:
+        return self._socket.fileno()
+
+    def _recv(self, count: int) -> bytes:
+        try:
+            return self._socket.recv(count)
+        except BlockingIOError:
+            return b''
+
+    def _send(self, data: memoryview) -> int:
+        return self._socket.send(data)
+
+    def close(self) -> None:
+        super(SocketStream, self).close()
+        self._socket.close()
+
+
+class FileDescriptorStream(_NonBlockingStream):
+    """
+    Stream over a file descriptor, e.g., one side of a pty (POSIX only).
+
+    .. versionadded:: 0.16
+
+    Parameters
+    ----------
+    fd : int
+        File descriptor, which is set to non-blocking mode.  The stream takes
+        ownership of :data:`fd`, i.e., closes it in :meth:`close`.
+    """
+
+    def __init__(self, fd: int) -> None:
+        os.set_blocking(fd, False)
+        self._fd = fd
+        super(FileDescriptorStream, self).__init__()
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def _recv(self, count: int) -> bytes:
+        try:
+            return os.read(self._fd, count)
+        except BlockingIOError:
+            return b''
+        except OSError as exception:
+            # Reading from a pty after the other side is closed fails with
+            # `EIO` (i.e., end of file).
+            if exception.errno != errno.EIO:
+                raise
+            return b''
+
+    def _send(self, data: memoryview) -> int:
+        return os.write(self._fd, data)
+
+    def close(self) -> None:
+        super(FileDescriptorStream, self).close()
+        os.close(self._fd)
+
+
+class PtyStream(FileDescriptorStream):
+    """
+    Stream over the master side of a new pseudo-terminal pair (POSIX only).
+
+    The device side of the pty _(see `device_fd` and `device_name`)_ behaves
+    like a serial port, e.g., it may be opened with `serial.Serial` or served
+    by a device emulator such as `nadamq.emulator.EchoDevice`.
+
+    .. versionadded:: 0.16
+    """
+
+    def __init__(self) -> None:
+        import pty
+        import tty
+
+        master_fd, self.device_fd = pty.openpty()
+        # Disable echo and line processing.
+        tty.setraw(self.device_fd)
+        self.device_name = os.ttyname(self.device_fd)
+        super(PtyStream, self).__init__(master_fd)
+
+    def close(self) -> None:
+        super(PtyStream, self).close()
+        os.close(self.device_fd)
+
+
 class RemoteNodeProxy:
     """
     By default, this class forwards all method calls through a connected device
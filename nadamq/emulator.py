@@ -0,0 +1,133 @@
+# coding: utf-8
+"""
+Device emulator, which answers nadamq packets without hardware, e.g., for
+throughput and latency tests.
+
+Usage:
+
+    python -m nadamq.emulator --tcp 5000
+    python -m nadamq.emulator --unix /tmp/nadamq.sock
+    python -m nadamq.emulator --pty
+
+.. versionadded:: 0.16
+"""
+import argparse
+import socket
+import threading
+
+from .command_proxy import PtyStream, SocketStream, Stream
+from .NadaMq import cPacketParser, PACKET_TYPES, serialize_many
+
+
+class EchoDevice:
+    """
+    Emulated device, which serves requests from a stream in a background
+    thread:
+
+     - `DATA` packet: respond with a `DATA` packet with the same `iuid` and
+       payload.
+     - `ID_REQUEST` packet: respond with an `ID_RESPONSE` packet with the
+       same `iuid` and :data:`device_id` as payload.
+
+    All responses to the requests parsed from each read are sent in a single
+    write.
+
+    .. versionadded:: 0.16
+
+    Parameters
+    ----------
+    stream : Stream
+        Device side of the connection.  Must support `read(timeout=...)`
+        _(e.g., `SocketStream`, `FileDescriptorStream`)_.  Closed when the
+        device is closed.
+    device_id : bytes, optional
+        Payload of `ID_RESPONSE` packets.
+    """
+
+    def __init__(self, stream: Stream, device_id: bytes = b'nadamq-echo') -> None:
+        self.stream = stream
+        self.device_id = device_id
+        self.request_count = 0
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> 'EchoDevice':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _serve(self) -> None:
+        parser = cPacketParser(resync=True)
+        while not self._closed.is_set():
+            try:
+                data = self.stream.read(timeout=.05)
+            except ValueError:
+                # Timed out; check whether device is closed.
+                continue
+            except (EOFError, OSError):
+                break
+            responses = []
+            for packet in parser.iter_packets(data):
+                if packet.type_ == PACKET_TYPES.DATA:
+                    responses.append((packet.iuid, PACKET_TYPES.DATA, packet.data()))
+                elif packet.type_ == PACKET_TYPES.ID_REQUEST:
+                    responses.append((packet.iuid, PACKET_TYPES.ID_RESPONSE, self.device_id))
+            if responses:
+                self.request_count += len(responses)
+                try:
+                    self.stream.write(serialize_many(responses))
+                except OSError:
+                    # Connection closed.
+                    break
+
+    def close(self) -> None:
+        self._closed.set()
+        self._thread.join()
+        self.stream.close()
+
+
+def _serve_forever(server: socket.socket) -> None:
+    while True:
+        connection, _ = server.accept()
+        EchoDevice(SocketStream(sock=connection))
+
+
+def main(args=None) -> None:
+    parser = argparse.ArgumentParser(description='Emulated nadamq echo device.')
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument('--tcp', type=int, metavar='PORT', help='Listen on TCP port.')
+    group.add_argument('--unix', metavar='PATH', help='Listen on Unix domain socket.')
+    group.add_argument('--pty', action='store_true', help='Serve pseudo-terminal device.')
+    args = parser.parse_args(args)
+
+    if args.pty:
+        # Serve the master side; clients open the device side as a serial port.
+        pty_stream = PtyStream()
+        print(f'Serving echo device on `{pty_stream.device_name}`.')
+        with EchoDevice(pty_stream):
+            try:
+                threading.Event().wait()
+            except KeyboardInterrupt:
+                pass
+        return
+    elif args.tcp is not None:
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind(('', args.tcp))
+        print(f'Serving echo device on TCP port {args.tcp}.')
+    else:
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(args.unix)
+        print(f'Serving echo device on `{args.unix}`.')
+    server.listen()
+    with server:
+        try:
+            _serve_forever(server)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
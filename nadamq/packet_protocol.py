@@ -0,0 +1,218 @@
+# coding: utf-8
+"""
+:mod:`asyncio` support for nadamq packet framing.
+
+.. versionadded:: 0.16
+"""
+import asyncio
+import os
+import time
+
+from typing import Optional, Tuple
+
+from . import ureg
+from .NadaMq import cPacketParser
+
+
+class PacketProtocol(asyncio.Protocol):
+    """
+    :class:`asyncio.Protocol` which parses packets from incoming data and
+    serializes outgoing packets.
+
+    Works over any :mod:`asyncio` transport, e.g.:
+
+     - sockets: ``loop.create_connection(PacketProtocol, host, port)``,
+     - pipes: ``loop.connect_read_pipe(...)``,
+     - bidirectional file descriptors, e.g., a pty or serial device: see
+       :func:`connect_fd`.
+
+    .. versionadded:: 0.16
+
+    Parameters
+    ----------
+    max_pending : int, optional
+        If set, pause reading from the transport while this many parsed
+        packets are waiting to be received (i.e., apply backpressure).
+    **kwargs
+        Keyword arguments passed to :class:`cPacketParser` (e.g.,
+        ``skip_garbage=True``).
+
+        The parser always recovers from a corrupted frame by resuming from
+        the next start flag, so packets following the corrupted frame are
+        not lost.  Unless ``resync=True``, each corrupted frame is also
+        reported to the receiver as a parse error (see :meth:`recv_packet`).
+    """
+
+    def __init__(self, max_pending: Optional[int] = None, **kwargs) -> None:
+        self._report_parse_errors = not kwargs.pop('resync', False)
+        self.parser = cPacketParser(resync=True, **kwargs)
+        self.transport = None
+        # Transport used for writing, if different from `transport` (see
+        # `connect_fd`).
+        self.write_transport = None
+        self._max_pending = max_pending
+        self._reading_paused = False
+        self._packets = asyncio.Queue()
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+        # Exception reported to receivers once the connection is lost.
+        self._closed_exception = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+        if self.write_transport is None:
+            self.write_transport = transport
+
+    def _put_parse_errors(self, resync_count: int) -> None:
+        """
+        Report each corrupted frame dropped by the parser since
+        :data:`resync_count` to the receiver.
+        """
+        if self._report_parse_errors:
+            for _ in range(self.parser.resync_count - resync_count):
+                self._packets.put_nowait(RuntimeError('Error parsing packet (corrupted frame dropped).'))
+
+    def data_received(self, data: bytes) -> None:
+        resync_count = self.parser.resync_count
+        for packet in self.parser.iter_packets(data):
+            # Report errors in order, i.e., before the packet which follows.
+            self._put_parse_errors(resync_count)
+            resync_count = self.parser.resync_count
+            self._packets.put_nowait(packet)
+        self._put_parse_errors(resync_count)
+        if (self._max_pending is not None and not self._reading_paused and
+                self._packets.qsize() >= self._max_pending):
+            self.transport.pause_reading()
+            self._reading_paused = True
+
+    def eof_received(self) -> Optional[bool]:
+        # Close the transport, which calls `connection_lost`.
+        return None
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._closed_exception = exc if exc is not None else EOFError('Connection closed.')
+        self._packets.put_nowait(self._closed_exception)
+        # Wake any senders waiting for the transport to drain.
+        self._can_write.set()
+
+    def pause_writing(self) -> None:
+        self._can_write.clear()
+
+    def resume_writing(self) -> None:
+        self._can_write.set()
+
+    async def recv_packet(self, timeout_s: Optional[float] = None) -> 'cPacket':
+        """
+        Receive next packet.
+
+        Parameters
+        ----------
+        timeout_s : float, optional
+            Number of seconds to wait for a packet.
+
+            By default, wait until a packet is received.
+
+        Returns
+        -------
+        cPacket
+            Parsed packet.
+
+        Raises
+        ------
+        RuntimeError
+            If specified time out is reached before a packet is received, or
+            if a parse error was encountered.
+        EOFError
+            If the connection was closed (or the exception the connection was
+            lost with).
+        """
+        start = time.time()
+        try:
+            result = await asyncio.wait_for(self._packets.get(), timeout_s)
+        except asyncio.TimeoutError:
+            timed_out = ureg.Quantity(time.time() - start, ureg.second)
+            raise RuntimeError(f'Timed out waiting for packet (after {timed_out:.1f}).')
+
+        if (self._reading_paused and self._closed_exception is None and
+                self._packets.qsize() < self._max_pending):
+            self._reading_paused = False
+            self.transport.resume_reading()
+
+        if result is self._closed_exception:
+            # Leave exception in queue to report it to any other receivers.
+            self._packets.put_nowait(result)
+            raise result
+        elif isinstance(result, Exception):
+            raise result
+        return result
+
+    async def send_packet(self, packet: 'cPacket') -> None:
+        """
+        Send a packet, waiting for the transport to drain if its write
+        buffer is full.
+
+        Raises
+        ------
+        ConnectionError
+            If the connection is closed.
+        """
+        if self._closed_exception is not None:
+            raise ConnectionError('Connection closed.')
+        self.write_transport.write(packet.tobytes())
+        await self._can_write.wait()
+
+    def close(self) -> None:
+        """
+        Close transport(s).
+        """
+        for transport in {self.transport, self.write_transport}:
+            if transport is not None:
+                transport.close()
+
+
+class _WritePipeProtocol(asyncio.Protocol):
+    """
+    Forward flow control events of a write pipe transport to a
+    :class:`PacketProtocol`.
+    """
+
+    def __init__(self, protocol: PacketProtocol) -> None:
+        self._protocol = protocol
+
+    def pause_writing(self) -> None:
+        self._protocol.pause_writing()
+
+    def resume_writing(self) -> None:
+        self._protocol.resume_writing()
+
+
+async def connect_fd(fd: int, **kwargs) -> Tuple[asyncio.BaseTransport, PacketProtocol]:
+    """
+    Connect a :class:`PacketProtocol` to a bidirectional file descriptor,
+    e.g., the master side of a pty, or a serial device (POSIX only).
+
+    .. versionadded:: 0.16
+
+    Parameters
+    ----------
+    fd : int
+        File descriptor.  It is duplicated, so the caller remains the owner
+        of :data:`fd`.
+    **kwargs
+        Keyword arguments passed to :class:`PacketProtocol`.
+
+    Returns
+    -------
+    tuple
+        Read transport and connected protocol.  Use
+        :meth:`PacketProtocol.close` to close both the read and write
+        transports.
+    """
+    loop = asyncio.get_running_loop()
+    protocol = PacketProtocol(**kwargs)
+    write_file = os.fdopen(os.dup(fd), 'wb', buffering=0)
+    protocol.write_transport, _ = await loop.connect_write_pipe(lambda: _WritePipeProtocol(protocol),
+                                                                write_file)
+    read_file = os.fdopen(os.dup(fd), 'rb', buffering=0)
+    transport, _ = await loop.connect_read_pipe(lambda: protocol, read_file)
+    return transport, protocol
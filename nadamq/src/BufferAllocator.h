@@ -35,25 +35,36 @@ class FixedSizeBufferPool {
    *  - Fixed number of buffers available. */
 protected:
   static const size_t padded_buffer_size = sizeof(size_t) + BufferSize;
+  /* Set in the header of each free slot (see "Buffer format" below). */
+  static const size_t free_flag = ((size_t)1) << (8 * sizeof(size_t) - 1);
   uint8_t super_buffer_[Count * padded_buffer_size];
-  bool occupied[Count];
-  uint32_t next_free;
+  /* ID of first slot in free-list (or `Count` if no slot is free). */
+  size_t free_head;
   uint32_t free_count;
+
+  size_t &header(size_t id) {
+    return *((size_t *)&super_buffer_[id * padded_buffer_size]);
+  }
+  size_t header(size_t id) const {
+    return *((const size_t *)&super_buffer_[id * padded_buffer_size]);
+  }
 public:
   /* Buffer format
    * =============
    * |<--size_t->||<--buffer size-->|
    * [ buffer ID ][ buffer contents ]
    * |<---- padded_buffer_size ---->|
-   */
-  FixedSizeBufferPool() : next_free(0), free_count(Count) {
+   *
+   * The header of each _free_ slot instead holds `free_flag | <next free slot
+   * ID>`, forming an intrusive free-list (terminated by `Count`), such that
+   * both `alloc` and `free` are O(1).  Since the header of an occupied slot
+   * holds the slot ID, freeing a slot that is already free is detected. */
+  FixedSizeBufferPool() : free_head(0), free_count(Count) {
     for (int i = 0; i < padded_buffer_size * Count; i++) {
       super_buffer_[i] = 0;
     }
     for (int i = 0; i < Count; i++) {
-      occupied[i] = false;
-      uint8_t *padded_buffer = &super_buffer_[i * padded_buffer_size];
-      *((size_t *)(padded_buffer)) = i;
+      header(i) = free_flag | (i + 1);
     }
   }
 
@@ -64,6 +75,8 @@ public:
     return free_count;
   }
 
+  bool occupied(size_t id) const { return header(id) == id; }
+
   uint8_t *buffer_by_id(uint32_t id) const {
     return (uint8_t *)&super_buffer_[id * padded_buffer_size + sizeof(size_t)];
   }
@@ -72,32 +85,39 @@ public:
     if (available() == 0) {
       return NULL;
     } else {
-      while (occupied[next_free]) {
-        next_free = (next_free + 1) % Count;
-      }
-      uint8_t *buffer = buffer_by_id(next_free);
-      occupied[next_free] = true;
+      /* Pop first slot from free-list. */
+      size_t buffer_id = free_head;
+      free_head = header(buffer_id) & ~free_flag;
+      header(buffer_id) = buffer_id;
       free_count--;
-      return buffer;
+      return buffer_by_id(buffer_id);
     }
   }
 
-  void free(uint8_t *buffer) {
-    /* Look up the buffer index, which occupies the four bytes immediately
-     * preceding the buffer contents in the super-buffer.  Use the buffer index
-     * to mark the buffer as unoccupied and increase the free count by one. */
-    size_t buffer_id = *((size_t *)(buffer - sizeof(size_t)));
-    if (buffer_id < Count && occupied[buffer_id]) {
-      occupied[buffer_id] = false;
-      free_count++;
+  bool free(uint8_t *buffer) {
+    /* Look up the buffer index from the position of the buffer in the
+     * super-buffer.  If the buffer is occupied, push it to the front of the
+     * free-list and increase the free count by one.
+     *
+     * Return `false` if the buffer does not belong to the pool, or is already
+     * free (i.e., double free). */
+    size_t offset = buffer - super_buffer_ - sizeof(size_t);
+    size_t buffer_id = offset / padded_buffer_size;
+    if (buffer < super_buffer_ + sizeof(size_t) || buffer_id >= Count ||
+        offset % padded_buffer_size != 0 || !occupied(buffer_id)) {
+      return false;
     }
+    header(buffer_id) = free_flag | free_head;
+    free_head = buffer_id;
+    free_count++;
+    return true;
   }
 
 #if !defined(AVR) && !defined(__arm__)
   void dump() const {
     std::cout << std::hex;
     for (int i = 0; i < Count; i++) {
-      if (occupied[i]) {
+      if (occupied(i)) {
         char *buffer = (char *)buffer_by_id(i);
 
         std::cout << std::setw(15) << "[" << i << "]: '";
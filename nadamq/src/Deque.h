@@ -88,30 +88,69 @@ T Deque<T>::pop_head() {
 
 
 template <typename T>
-class BoundedDeque : public Deque<T> {
-public:
-  typedef Deque<T> base_type;
+class BoundedDeque {
+  /* # `BoundedDeque` #
+   *
+   * Fixed-capacity deque with the same API as `Deque`, backed by a ring buffer
+   * of `max_size` items allocated once on construction (i.e., no heap
+   * allocation per item).
+   *
+   * Items are stored from `head` (index `start_`) to `tail`, wrapping around
+   * the end of the array.
+   *
+   * Since all `max_size` items are constructed up front, callers must size the
+   * deque for the target _(e.g., a few packets on a microcontroller)_.  A
+   * `max_size` of zero yields a deque which is always full, i.e., `push` and
+   * `append` always return `false`. */
 protected:
+  T *items_;
   size_t max_size_;
-  using base_type::item_count_;
+  size_t start_;
+  size_t item_count_;
+
+  size_t index(size_t offset) const {
+    /* Guard against division by zero for a zero-capacity deque. */
+    return (max_size_ > 0) ? (start_ + offset) % max_size_ : 0;
+  }
+private:
+  /* Not copyable. */
+  BoundedDeque(BoundedDeque const &);
+  BoundedDeque &operator=(BoundedDeque const &);
 public:
-  BoundedDeque(size_t max_size) : base_type(), max_size_(max_size) {}
+  BoundedDeque(size_t max_size)
+    : items_((max_size > 0) ? new T[max_size] : NULL), max_size_(max_size),
+      start_(0), item_count_(0) {}
+  ~BoundedDeque() { delete [] items_; }
+
   bool append(T item) {
-    if (!full()) {
-      base_type::append(item);
-      return true;
-    } else {
-      return false;
-    }
+    /* Add item after tail. */
+    if (full()) { return false; }
+    items_[index(item_count_)] = item;
+    item_count_++;
+    return true;
   }
   bool push(T item) {
-    if (!full()) {
-      base_type::push(item);
-      return true;
-    } else {
-      return false;
-    }
+    /* Add item before head. */
+    if (full()) { return false; }
+    start_ = index(max_size_ - 1);
+    items_[start_] = item;
+    item_count_++;
+    return true;
   }
+  T pop_tail() {
+    item_count_--;
+    return items_[index(item_count_)];
+  }
+  T pop_head() {
+    T item = items_[start_];
+    start_ = index(1);
+    item_count_--;
+    return item;
+  }
+  T &head() const { return items_[start_]; }
+  T &tail() const { return items_[index(item_count_ - 1)]; }
+  bool empty() const { return (item_count_ == 0); }
+  size_t size() const { return item_count_; }
   bool full() const { return (item_count_ == max_size_); }
 };
 
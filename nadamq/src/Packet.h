@@ -104,8 +104,8 @@ public:
   uint16_t compute_crc() {
     /* Compute the CRC of the packet payload. */
     crc_ = crc_init();
-    for (uint16_t i = 0; i < payload_length_; i++) {
-      crc_ = update_crc(crc_, payload_buffer_[i]);
+    if (payload_length_ > 0) {
+      crc_ = update_crc(crc_, payload_buffer_, payload_length_);
     }
     crc_ = finalize_crc(crc_);
     return crc_;
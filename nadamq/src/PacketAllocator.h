@@ -2,16 +2,12 @@
 #define ___PACKET_ALLOCATOR__H___
 
 #include <stdint.h>
-#if !defined(AVR) && !defined(__arm__)
-#include <iostream>
-#include <iomanip>
-#include <iterator>
-#include <algorithm>
-#endif  // #ifndef AVR
 #include "BufferAllocator.h"
+#include "PacketTrace.h"
 
 
-template <typename Packet, typename Allocator=FixedSizeBufferPool<128, 10> >
+template <typename Packet, typename Allocator=FixedSizeBufferPool<128, 10>,
+          typename Trace=NullPacketTrace>
 class PacketAllocator {
   /* # `PacketAllocator` #
    *
@@ -19,12 +15,18 @@ class PacketAllocator {
    * provided buffer allocator.  This is particularly helpful in embedded
    * environments, where it is useful to bound memory usage.  In such a
    * scenario, a specialized allocator may be used to specialize memory
-   * allocation and management _(e.g., `FixedSizeBufferPool`)_. */
+   * allocation and management _(e.g., `FixedSizeBufferPool`)_.
+   *
+   * Each packet created/freed is reported to the `Trace` policy _(see
+   * `PacketTrace.h`)_, which ignores all events by default. */
 protected:
   Allocator *buffer_allocator_;
 public:
   typedef Packet packet_type;
   typedef Allocator allocator_type;
+  typedef Trace trace_type;
+
+  Trace trace_;
 
   /* Buffer format
    * =============
@@ -50,11 +52,7 @@ public:
     }
     /* Assign buffer to packet. */
     packet.reset_buffer(buffer_size, buffer);
-#if !defined(AVR) && !defined(__arm__)
-    std::cout << "# `PacketAllocator::create_packet()` (" << available()
-              << "/" << buffer_allocator_->buffer_count() << ") now available #"
-              << std::endl << std::endl;
-#endif  // #ifndef AVR
+    trace_(TRACE_PACKET_CREATED, packet, available());
     return packet;
   }
 
@@ -65,11 +63,7 @@ public:
     if (packet.payload_buffer_ != NULL) {
       buffer_allocator_->free(packet.payload_buffer_);
     }
-#if !defined(AVR) && !defined(__arm__)
-    std::cout << "# `PacketAllocator::free_packet_buffer()` (" << available()
-              << "/" << buffer_allocator_->buffer_count() << ") now available #" << std::endl
-              << std::endl;
-#endif  // #ifndef AVR
+    trace_(TRACE_PACKET_FREED, packet, available());
   }
 
   size_t available() const {
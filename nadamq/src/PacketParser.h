@@ -3,6 +3,7 @@
 
 #include <stdint.h>
 #include <stdlib.h>
+#include <string.h>
 #include "crc_common.h"
 
 #if !defined(AVR) && !defined(__arm__)
@@ -15,6 +16,38 @@ using namespace std;
 #include "Packet.h"
 
 
+inline size_t find_start_flag(const uint8_t *data, size_t length) {
+  /* Return the offset of the first `|||` start flag in `data`.
+   *
+   * If there is no complete start flag, return the offset of a trailing
+   * partial start flag _(i.e., `|` or `||` at the end of `data`)_, since the
+   * rest of the flag may arrive with the next bytes.  Otherwise, return
+   * `length`.
+   *
+   * Candidate flags are located using `memchr`, which jumps over garbage
+   * _(e.g., debug output)_ much faster than feeding it to the parser one
+   * byte at a time. */
+  const uint8_t *position = data;
+  const uint8_t *end = data + length;
+
+  while (position < end) {
+    position = static_cast<const uint8_t *>(memchr(position, '|',
+                                                   end - position));
+    if (position == NULL) { break; }
+    if (end - position >= 3) {
+      if (position[1] == '|' && position[2] == '|') {
+        return position - data;
+      }
+    } else if (end - position == 1 || position[1] == '|') {
+      /* Trailing partial start flag. */
+      return position - data;
+    }
+    position++;
+  }
+  return length;
+}
+
+
 class Parser {
 public:
   bool message_completed_;
@@ -80,6 +113,7 @@ public:
   }
 
   void parse_byte(uint8_t *byte);
+  size_t parse_buffer(const uint8_t *data, size_t length);
 
   template <typename Stream>
   int8_t parse(Stream &stream, Packet &packet) {
@@ -15,6 +15,7 @@ using namespace std;
 #endif // ifndef AVR
 
 #include "PacketAllocator.h"
+#include "PacketTrace.h"
 
 
 class PacketSocket {
@@ -52,11 +53,15 @@ public:
 
 
 template <typename StreamPacketParser,
-          typename Allocator=PacketAllocator<typename StreamPacketParser::packet_type> >
+          typename Allocator=PacketAllocator<typename StreamPacketParser::packet_type>,
+          typename Trace=NullPacketTrace>
 class StreamPacketSocket : public PacketSocket {
+  /* Each packet processed is reported to the `Trace` policy _(see
+   * `PacketTrace.h`)_, which ignores all events by default. */
 public:
   typedef PacketSocket base_type;
   typedef typename StreamPacketParser::packet_type packet_type;
+  typedef Trace trace_type;
 protected:
   bool push_event(uint8_t event) { return event_queue_.push(event); }
 
@@ -67,18 +72,7 @@ protected:
       return;
     }
     tx_packet_ = tx_queue_.pop_tail();
-#if !defined(AVR) && !defined(__arm__)
-    std::cout << std::endl << "# TX packet info #" << std::endl
-              << std::endl;
-    std::cout << std::setw(23) << "uuid: " << tx_packet_.iuid_ << std::endl;
-    std::cout << std::setw(23) << "type: "
-              << static_cast<char>(tx_packet_.type()) << std::endl;
-    if (tx_packet_.type() == packet_type::packet_type::DATA) {
-      std::cout << std::setw(23) << "data payload: " << "'"
-                << std::string((char *)tx_packet_.payload_buffer_,
-                               tx_packet_.payload_length_) << "'" << std::endl;
-    }
-#endif  // #ifndef AVR
+    trace_(TRACE_TX_PACKET, tx_packet_, tx_queue_.size());
     allocator_->free_packet_buffer(tx_packet_);
     event_queue_.push('s');
   }
@@ -90,13 +84,7 @@ protected:
       return;
     }
     rx_packet_ = rx_queue_.pop_tail();
-#if !defined(AVR) && !defined(__arm__)
-    std::cout << std::endl << "## Data packet info ##" << std::endl << std::endl;
-    std::cout << std::setw(23) << "uuid: " << rx_packet_.iuid_ << std::endl;
-    std::cout << std::setw(23) << "data payload: " << "'"
-              << std::string((char *)rx_packet_.payload_buffer_,
-                             rx_packet_.payload_length_) << "'" << std::endl;
-#endif  // #ifndef AVR
+    trace_(TRACE_RX_PACKET, rx_packet_, rx_queue_.size());
     /* Need to deallocate buffer here until we transfer ownership to somewhere
      * else, e.g., packet-stream. */
     /* TODO
@@ -139,6 +127,7 @@ public:
   packet_type rx_packet_;
   /* Complete packet that is currently being processed. */
   packet_type tx_packet_;
+  Trace trace_;
 
   StreamPacketSocket(StreamPacketParser &parser, Allocator *allocator,
                      size_t event_queue_length, size_t rx_queue_length,
@@ -282,30 +271,22 @@ public:
      * is common, the allocator buffer count could be increased to avoid this
      * scenario.
      * */
-#if !defined(AVR) && !defined(__arm__)
-    std::cout << "# `handle_no_free_packets()` #" << std::endl;
-#endif  // #ifndef AVR
+    trace_(TRACE_NO_FREE_PACKETS, parser_packet_, rx_queue_.size());
   }
 
   virtual void handle_queue_full() {
-#if !defined(AVR) && !defined(__arm__)
-    std::cout << "# `handle_queue_full()` #" << std::endl;
-#endif  // #ifndef AVR
+    trace_(TRACE_QUEUE_FULL, parser_packet_, rx_queue_.size());
   }
 
   virtual void queue_nack_queue_full() {
-#if !defined(AVR) && !defined(__arm__)
-    std::cout << "# `queue_nack_queue_full()` #" << std::endl;
-#endif  // #ifndef AVR
+    trace_(TRACE_NACK_QUEUE_FULL, parser_packet_, tx_queue_.size());
   }
 
   virtual void handle_packet() {
     /* # `handle_packet` #
      *
      * Process a fully parsed packet. */
-#if !defined(AVR) && !defined(__arm__)
-    std::cout << "# `handle_packet()` #" << std::endl;
-#endif  // #ifndef AVR
+    trace_(TRACE_HANDLE_PACKET, parser_packet_, rx_queue_.size());
     /* A full packet has been parsed successfully.  Push `packet_ready` event
      * onto queue to trigger update of receiving packet queue. */
     /* Packet type should be: `d` _(data)_, `a` _(ack)_, or `n` _(nack)_. */
@@ -1,6 +1,7 @@
 #ifndef ___PACKET_STREAM__H___
 #define ___PACKET_STREAM__H___
 
+#include <string.h>  // `memcpy`
 #include "Deque.h"
 
 template <typename PacketAllocator>
@@ -69,8 +70,6 @@ public:
    *     - `flush()`
    *     - `parsefloat()`
    *     - `parseInt()`
-   *     - `peek()`
-   *     - `readBytes()`
    *     - `readBytesUntil()`
    *     - `readString()`
    *     - `readStringUntil()`
@@ -80,6 +79,8 @@ public:
    *
    *     - `available()`
    *     - `read()`
+   *     - `peek()`
+   *     - `readBytes()` _(as `read_bytes()`)_
    *
    * [1]: http://arduino.cc/en/Reference/Stream
    */
@@ -111,12 +112,17 @@ protected:
     while (packet_queue_.size() > 0 && packet_available() == 0) {
       allocator_->free_packet_buffer(packet_queue_.tail());
       packet_queue_.pop_tail();
-      data_ = packet_queue_.tail().payload_buffer_;
+      /* Reset `data_` once the queue is empty, so that the next packet pushed
+       * becomes the active packet. */
+      data_ = (packet_queue_.size() > 0) ? packet_queue_.tail().payload_buffer_
+                                         : NULL;
     }
   }
 
 public:
-  PacketStream(PacketAllocator *packet_allocator, size_t max_queue_length=1024)
+  /* All `max_queue_length` queued packets are constructed up front, so there
+   * is no default queue length: size the queue for the target. */
+  PacketStream(PacketAllocator *packet_allocator, size_t max_queue_length)
     : allocator_(packet_allocator), packet_queue_(max_queue_length),
       data_(NULL), bytes_available_(0) {}
 
@@ -133,13 +139,17 @@ public:
   }
 
   bool push(packet_type &packet) {
+    if (!packet_queue_.push(packet)) {
+      /* Queue is full, so packet was dropped. */
+      return false;
+    }
     /* Add the number of bytes in the new packet to the total number of bytes
      * available. */
     bytes_available_ += packet.payload_length_;
     if (data_ == NULL) {
       data_ = packet.payload_buffer_;
     }
-    return packet_queue_.push(packet);
+    return true;
   }
 
   int available() const {
@@ -166,6 +176,46 @@ public:
 
     return value;
   }
+
+  int peek() {
+    /* Return the next byte without consuming it, or -1 if there are no bytes
+     * available. */
+    if (available() <= 0) {
+      return -1;
+    }
+    prepare_active_packet();
+    return *data_;
+  }
+
+  size_t read_bytes(uint8_t *buffer, size_t length) {
+    /* # `read_bytes` #
+     *
+     * Read up to `length` bytes into `buffer`, across packet boundaries.
+     *
+     * The remaining payload of each packet is copied with a single `memcpy`,
+     * and each exhausted packet is freed as soon as it has been read.
+     *
+     * Returns
+     * -------
+     *
+     * Number of bytes read _(less than `length` if fewer bytes are
+     * available)_. */
+    size_t count = 0;
+    while (count < length && available() > 0) {
+      prepare_active_packet();
+      size_t chunk_size = packet_available();
+      if (chunk_size == 0) { break; }
+      if (chunk_size > length - count) { chunk_size = length - count; }
+      memcpy(buffer + count, data_, chunk_size);
+      data_ += chunk_size;
+      bytes_available_ -= chunk_size;
+      count += chunk_size;
+    }
+    /* Deallocate the last packet read if it is exhausted, and activate the
+     * next packet _(if available)_. */
+    prepare_active_packet();
+    return count;
+  }
 };
 
 
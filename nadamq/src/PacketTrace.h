@@ -0,0 +1,110 @@
+#ifndef ___PACKET_TRACE__H___
+#define ___PACKET_TRACE__H___
+
+#include <stdint.h>
+#include <stdlib.h>
+#if !defined(AVR) && !defined(__arm__)
+#include <iostream>
+#include <iomanip>
+#include <string>
+#endif  // #ifndef AVR
+
+
+/* # Packet trace events #
+ *
+ * Events reported by `PacketAllocator` and `StreamPacketSocket` to their
+ * `Trace` policy.  Each event is reported along with the corresponding packet
+ * and a value:
+ *
+ *  - `PacketAllocator` events: number of buffers still available.
+ *  - `StreamPacketSocket` events: number of packets in the corresponding
+ *    queue. */
+enum PacketTraceEvent {
+  TRACE_PACKET_CREATED,  // `PacketAllocator::create_packet()`
+  TRACE_PACKET_FREED,  // `PacketAllocator::free_packet_buffer()`
+  TRACE_TX_PACKET,  // `StreamPacketSocket::process_tx_packet()`
+  TRACE_RX_PACKET,  // `StreamPacketSocket::process_rx_packet()`
+  TRACE_HANDLE_PACKET,  // `StreamPacketSocket::handle_packet()`
+  TRACE_NO_FREE_PACKETS,  // `StreamPacketSocket::handle_no_free_packets()`
+  TRACE_QUEUE_FULL,  // `StreamPacketSocket::handle_queue_full()`
+  TRACE_NACK_QUEUE_FULL,  // `StreamPacketSocket::queue_nack_queue_full()`
+  TRACE_EVENT_COUNT
+};
+
+
+struct NullPacketTrace {
+  /* # `NullPacketTrace` #
+   *
+   * Default trace policy, which ignores all events, i.e., tracing compiles
+   * away completely. */
+  template <typename Packet>
+  void operator()(PacketTraceEvent event, Packet const &packet, size_t value) {}
+};
+
+
+struct CountingPacketTrace {
+  /* # `CountingPacketTrace` #
+   *
+   * Trace policy, which counts the occurrences of each event, e.g.:
+   *
+   *     socket.trace_.count(TRACE_QUEUE_FULL)
+   */
+  uint32_t counts_[TRACE_EVENT_COUNT];
+
+  CountingPacketTrace() { reset(); }
+
+  void reset() {
+    for (int i = 0; i < TRACE_EVENT_COUNT; i++) { counts_[i] = 0; }
+  }
+
+  uint32_t count(PacketTraceEvent event) const { return counts_[event]; }
+
+  template <typename Packet>
+  void operator()(PacketTraceEvent event, Packet const &packet, size_t value) {
+    counts_[event]++;
+  }
+};
+
+
+#if !defined(AVR) && !defined(__arm__)
+inline const char *trace_event_label(PacketTraceEvent event) {
+  switch (event) {
+    case TRACE_PACKET_CREATED: return "packet_created";
+    case TRACE_PACKET_FREED: return "packet_freed";
+    case TRACE_TX_PACKET: return "tx_packet";
+    case TRACE_RX_PACKET: return "rx_packet";
+    case TRACE_HANDLE_PACKET: return "handle_packet";
+    case TRACE_NO_FREE_PACKETS: return "no_free_packets";
+    case TRACE_QUEUE_FULL: return "queue_full";
+    case TRACE_NACK_QUEUE_FULL: return "nack_queue_full";
+    default: return "<unknown event>";
+  }
+}
+
+
+struct OstreamPacketTrace {
+  /* # `OstreamPacketTrace` #
+   *
+   * Trace policy, which writes a line describing each event to an output
+   * stream _(`std::cout` by default)_. */
+  std::ostream &output_;
+
+  OstreamPacketTrace() : output_(std::cout) {}
+  OstreamPacketTrace(std::ostream &output) : output_(output) {}
+
+  template <typename Packet>
+  void operator()(PacketTraceEvent event, Packet const &packet, size_t value) {
+    output_ << "# `" << trace_event_label(event) << "` (iuid: "
+            << packet.iuid_ << ", type: " << static_cast<char>(packet.type())
+            << ", value: " << value << ")";
+    if (packet.type() == Packet::packet_type::DATA &&
+        packet.payload_buffer_ != NULL) {
+      output_ << " '" << std::string((char *)packet.payload_buffer_,
+                                     packet.payload_length_) << "'";
+    }
+    output_ << " #" << std::endl;
+  }
+};
+#endif  // #ifndef AVR
+
+#endif  // #ifndef ___PACKET_TRACE__H___
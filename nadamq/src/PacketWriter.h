@@ -9,6 +9,7 @@ using namespace std;
 #endif // ifndef AVR
 #include <stdint.h>
 #include <stdlib.h>
+#include <string.h>
 
 #include "Packet.h"
 
@@ -46,6 +47,64 @@ void serialize_any(Stream &output, T const &value) {
 }
 
 
+template <typename Packet>
+inline bool packet_has_payload(Packet const &packet) {
+  /* Only ``DATA``, ``STREAM`` and ``ID_RESPONSE`` packets are serialized with
+   * a length, payload and CRC checksum. */
+  return ((packet.type() == Packet::packet_type::DATA) ||
+          (packet.type() == Packet::packet_type::STREAM) ||
+          (packet.type() == Packet::packet_type::ID_RESPONSE));
+}
+
+
+template <typename Packet>
+inline size_t packet_serialized_size(Packet const &packet) {
+  /* Return the number of bytes written by `write_packet` for `packet`. */
+  size_t size = 3 + sizeof(packet.iuid_) + sizeof(uint8_t);
+  if (packet_has_payload(packet)) {
+    size += sizeof(uint16_t) + packet.payload_length_ + sizeof(packet.crc_);
+  }
+  return size;
+}
+
+
+template <typename Packet>
+inline size_t write_packet_buffer(uint8_t *output, Packet const &packet) {
+  /* Write the same bytes as `write_packet` directly to `output`, which must
+   * have room for at least `packet_serialized_size(packet)` bytes.
+   *
+   * The CRC checksum is computed from the payload, but, unlike
+   * `write_packet`, the packet is neither copied nor modified.
+   *
+   * Returns the number of bytes written. */
+  uint8_t *position = output;
+
+  *position++ = '|';
+  *position++ = '|';
+  *position++ = '|';
+  *position++ = static_cast<uint8_t>(packet.iuid_ >> 8);
+  *position++ = static_cast<uint8_t>(packet.iuid_ & 0x0FF);
+  *position++ = static_cast<uint8_t>(packet.type());
+
+  if (packet_has_payload(packet)) {
+    uint16_t length = packet.payload_length_;
+    uint16_t crc = crc_init();
+
+    *position++ = static_cast<uint8_t>(length >> 8);
+    *position++ = static_cast<uint8_t>(length & 0x0FF);
+    if (length > 0) {
+      memcpy(position, packet.payload_buffer_, length);
+      crc = update_crc(crc, packet.payload_buffer_, length);
+      position += length;
+    }
+    crc = finalize_crc(crc);
+    *position++ = static_cast<uint8_t>(crc >> 8);
+    *position++ = static_cast<uint8_t>(crc & 0x0FF);
+  }
+  return position - output;
+}
+
+
 template <typename Stream, typename Packet>
 inline void write_packet(Stream &output, Packet const &packet) {
   /* ..versionchanged:: 0.13
@@ -12,11 +12,126 @@
  *    XorOut       = 0x0000
  *    ReflectOut   = True
  *    Algorithm    = bit-by-bit-fast
+ *
+ * The table-driven and slice-by-8 engines (see `crc-16.h`) keep the
+ * bit-by-bit-fast register representation at the `crc_update` boundary, so
+ * intermediate values, as well as final checksums, are identical for every
+ * algorithm.
  *****************************************************************************/
 #include "crc-16.h"     /* include the header file generated with pycrc */
 #include <stdlib.h>
 #include <stdint.h>
 
+
+#if defined(CRC_ALGO_TABLE_DRIVEN) || defined(CRC_ALGO_SLICE_BY_8)
+/**
+ * Static table used for the table-driven implementation, i.e., the CRC of
+ * each possible input byte, using the *reflected* polynomial (`0xa001`).
+ *****************************************************************************/
+static const crc_t crc_table[256] = {
+    0x0000, 0xc0c1, 0xc181, 0x0140, 0xc301, 0x03c0, 0x0280, 0xc241,
+    0xc601, 0x06c0, 0x0780, 0xc741, 0x0500, 0xc5c1, 0xc481, 0x0440,
+    0xcc01, 0x0cc0, 0x0d80, 0xcd41, 0x0f00, 0xcfc1, 0xce81, 0x0e40,
+    0x0a00, 0xcac1, 0xcb81, 0x0b40, 0xc901, 0x09c0, 0x0880, 0xc841,
+    0xd801, 0x18c0, 0x1980, 0xd941, 0x1b00, 0xdbc1, 0xda81, 0x1a40,
+    0x1e00, 0xdec1, 0xdf81, 0x1f40, 0xdd01, 0x1dc0, 0x1c80, 0xdc41,
+    0x1400, 0xd4c1, 0xd581, 0x1540, 0xd701, 0x17c0, 0x1680, 0xd641,
+    0xd201, 0x12c0, 0x1380, 0xd341, 0x1100, 0xd1c1, 0xd081, 0x1040,
+    0xf001, 0x30c0, 0x3180, 0xf141, 0x3300, 0xf3c1, 0xf281, 0x3240,
+    0x3600, 0xf6c1, 0xf781, 0x3740, 0xf501, 0x35c0, 0x3480, 0xf441,
+    0x3c00, 0xfcc1, 0xfd81, 0x3d40, 0xff01, 0x3fc0, 0x3e80, 0xfe41,
+    0xfa01, 0x3ac0, 0x3b80, 0xfb41, 0x3900, 0xf9c1, 0xf881, 0x3840,
+    0x2800, 0xe8c1, 0xe981, 0x2940, 0xeb01, 0x2bc0, 0x2a80, 0xea41,
+    0xee01, 0x2ec0, 0x2f80, 0xef41, 0x2d00, 0xedc1, 0xec81, 0x2c40,
+    0xe401, 0x24c0, 0x2580, 0xe541, 0x2700, 0xe7c1, 0xe681, 0x2640,
+    0x2200, 0xe2c1, 0xe381, 0x2340, 0xe101, 0x21c0, 0x2080, 0xe041,
+    0xa001, 0x60c0, 0x6180, 0xa141, 0x6300, 0xa3c1, 0xa281, 0x6240,
+    0x6600, 0xa6c1, 0xa781, 0x6740, 0xa501, 0x65c0, 0x6480, 0xa441,
+    0x6c00, 0xacc1, 0xad81, 0x6d40, 0xaf01, 0x6fc0, 0x6e80, 0xae41,
+    0xaa01, 0x6ac0, 0x6b80, 0xab41, 0x6900, 0xa9c1, 0xa881, 0x6840,
+    0x7800, 0xb8c1, 0xb981, 0x7940, 0xbb01, 0x7bc0, 0x7a80, 0xba41,
+    0xbe01, 0x7ec0, 0x7f80, 0xbf41, 0x7d00, 0xbdc1, 0xbc81, 0x7c40,
+    0xb401, 0x74c0, 0x7580, 0xb541, 0x7700, 0xb7c1, 0xb681, 0x7640,
+    0x7200, 0xb2c1, 0xb381, 0x7340, 0xb101, 0x71c0, 0x7080, 0xb041,
+    0x5000, 0x90c1, 0x9181, 0x5140, 0x9301, 0x53c0, 0x5280, 0x9241,
+    0x9601, 0x56c0, 0x5780, 0x9741, 0x5500, 0x95c1, 0x9481, 0x5440,
+    0x9c01, 0x5cc0, 0x5d80, 0x9d41, 0x5f00, 0x9fc1, 0x9e81, 0x5e40,
+    0x5a00, 0x9ac1, 0x9b81, 0x5b40, 0x9901, 0x59c0, 0x5880, 0x9841,
+    0x8801, 0x48c0, 0x4980, 0x8941, 0x4b00, 0x8bc1, 0x8a81, 0x4a40,
+    0x4e00, 0x8ec1, 0x8f81, 0x4f40, 0x8d01, 0x4dc0, 0x4c80, 0x8c41,
+    0x4400, 0x84c1, 0x8581, 0x4540, 0x8701, 0x47c0, 0x4680, 0x8641,
+    0x8201, 0x42c0, 0x4380, 0x8341, 0x4100, 0x81c1, 0x8081, 0x4040
+};
+
+
+/**
+ * Bit-reversed value of each possible byte.
+ *****************************************************************************/
+static const uint8_t crc_reflect_table[256] = {
+    0x00, 0x80, 0x40, 0xc0, 0x20, 0xa0, 0x60, 0xe0, 0x10, 0x90, 0x50, 0xd0,
+    0x30, 0xb0, 0x70, 0xf0, 0x08, 0x88, 0x48, 0xc8, 0x28, 0xa8, 0x68, 0xe8,
+    0x18, 0x98, 0x58, 0xd8, 0x38, 0xb8, 0x78, 0xf8, 0x04, 0x84, 0x44, 0xc4,
+    0x24, 0xa4, 0x64, 0xe4, 0x14, 0x94, 0x54, 0xd4, 0x34, 0xb4, 0x74, 0xf4,
+    0x0c, 0x8c, 0x4c, 0xcc, 0x2c, 0xac, 0x6c, 0xec, 0x1c, 0x9c, 0x5c, 0xdc,
+    0x3c, 0xbc, 0x7c, 0xfc, 0x02, 0x82, 0x42, 0xc2, 0x22, 0xa2, 0x62, 0xe2,
+    0x12, 0x92, 0x52, 0xd2, 0x32, 0xb2, 0x72, 0xf2, 0x0a, 0x8a, 0x4a, 0xca,
+    0x2a, 0xaa, 0x6a, 0xea, 0x1a, 0x9a, 0x5a, 0xda, 0x3a, 0xba, 0x7a, 0xfa,
+    0x06, 0x86, 0x46, 0xc6, 0x26, 0xa6, 0x66, 0xe6, 0x16, 0x96, 0x56, 0xd6,
+    0x36, 0xb6, 0x76, 0xf6, 0x0e, 0x8e, 0x4e, 0xce, 0x2e, 0xae, 0x6e, 0xee,
+    0x1e, 0x9e, 0x5e, 0xde, 0x3e, 0xbe, 0x7e, 0xfe, 0x01, 0x81, 0x41, 0xc1,
+    0x21, 0xa1, 0x61, 0xe1, 0x11, 0x91, 0x51, 0xd1, 0x31, 0xb1, 0x71, 0xf1,
+    0x09, 0x89, 0x49, 0xc9, 0x29, 0xa9, 0x69, 0xe9, 0x19, 0x99, 0x59, 0xd9,
+    0x39, 0xb9, 0x79, 0xf9, 0x05, 0x85, 0x45, 0xc5, 0x25, 0xa5, 0x65, 0xe5,
+    0x15, 0x95, 0x55, 0xd5, 0x35, 0xb5, 0x75, 0xf5, 0x0d, 0x8d, 0x4d, 0xcd,
+    0x2d, 0xad, 0x6d, 0xed, 0x1d, 0x9d, 0x5d, 0xdd, 0x3d, 0xbd, 0x7d, 0xfd,
+    0x03, 0x83, 0x43, 0xc3, 0x23, 0xa3, 0x63, 0xe3, 0x13, 0x93, 0x53, 0xd3,
+    0x33, 0xb3, 0x73, 0xf3, 0x0b, 0x8b, 0x4b, 0xcb, 0x2b, 0xab, 0x6b, 0xeb,
+    0x1b, 0x9b, 0x5b, 0xdb, 0x3b, 0xbb, 0x7b, 0xfb, 0x07, 0x87, 0x47, 0xc7,
+    0x27, 0xa7, 0x67, 0xe7, 0x17, 0x97, 0x57, 0xd7, 0x37, 0xb7, 0x77, 0xf7,
+    0x0f, 0x8f, 0x4f, 0xcf, 0x2f, 0xaf, 0x6f, 0xef, 0x1f, 0x9f, 0x5f, 0xdf,
+    0x3f, 0xbf, 0x7f, 0xff
+};
+
+
+/**
+ * Reflect the 16 bits of a \a data word using `crc_reflect_table`.
+ *****************************************************************************/
+static inline crc_t crc_reflect16(crc_t data)
+{
+    return (crc_t)((crc_reflect_table[data & 0xff] << 8) |
+                   crc_reflect_table[(data >> 8) & 0xff]);
+}
+#endif  // #if defined(CRC_ALGO_TABLE_DRIVEN) || defined(CRC_ALGO_SLICE_BY_8)
+
+
+#ifdef CRC_ALGO_SLICE_BY_8
+/**
+ * Tables used for the slice-by-8 implementation.
+ *
+ * `table[k][i]` is the CRC of byte `i` followed by `k` zero bytes, so
+ * `table[0]` is identical to `crc_table`.  The tables are derived from
+ * `crc_table` once, during static initialization.
+ *****************************************************************************/
+struct CrcSliceTables {
+    crc_t table[8][256];
+
+    CrcSliceTables() {
+        for (unsigned int i = 0; i < 256; i++) {
+            table[0][i] = crc_table[i];
+        }
+        for (unsigned int k = 1; k < 8; k++) {
+            for (unsigned int i = 0; i < 256; i++) {
+                crc_t crc = table[k - 1][i];
+                table[k][i] = (crc >> 8) ^ crc_table[crc & 0xff];
+            }
+        }
+    }
+};
+
+static const CrcSliceTables crc_slice_tables;
+#endif  // #ifdef CRC_ALGO_SLICE_BY_8
+
+
 /**
  * Reflect all bits of a \a data word of \a data_len bytes.
  *
@@ -29,6 +144,12 @@ crc_t crc_reflect(crc_t data, size_t data_len)
     unsigned int i;
     crc_t ret;
 
+#if defined(CRC_ALGO_TABLE_DRIVEN) || defined(CRC_ALGO_SLICE_BY_8)
+    if (data_len == 16) {
+        return crc_reflect16(data);
+    }
+#endif  // #if defined(CRC_ALGO_TABLE_DRIVEN) || defined(CRC_ALGO_SLICE_BY_8)
+
     ret = data & 0x01;
     for (i = 1; i < data_len; i++) {
         data >>= 1;
@@ -46,6 +167,34 @@ crc_t crc_reflect(crc_t data, size_t data_len)
  * \param data_len Number of bytes in the \a data buffer.
  * \return         The updated crc value.
  *****************************************************************************/
+#if defined(CRC_ALGO_TABLE_DRIVEN) || defined(CRC_ALGO_SLICE_BY_8)
+crc_t crc_update(crc_t crc, const unsigned char *data, size_t data_len)
+{
+    /* The tables operate on a reflected register, while the bit-by-bit-fast
+     * algorithm (and, therefore, `crc_init`/`crc_finalize`) work on an
+     * unreflected register.  Convert on the way in and on the way out. */
+    crc = crc_reflect16(crc);
+
+#ifdef CRC_ALGO_SLICE_BY_8
+    const crc_t (*table)[256] = crc_slice_tables.table;
+
+    while (data_len >= 8) {
+        crc ^= (crc_t)(data[0] | (data[1] << 8));
+        crc = table[7][crc & 0xff] ^ table[6][crc >> 8] ^
+              table[5][data[2]] ^ table[4][data[3]] ^
+              table[3][data[4]] ^ table[2][data[5]] ^
+              table[1][data[6]] ^ table[0][data[7]];
+        data += 8;
+        data_len -= 8;
+    }
+#endif  // #ifdef CRC_ALGO_SLICE_BY_8
+
+    while (data_len--) {
+        crc = (crc >> 8) ^ crc_table[(crc ^ *data++) & 0xff];
+    }
+    return crc_reflect16(crc);
+}
+#else
 crc_t crc_update(crc_t crc, const unsigned char *data, size_t data_len)
 {
     unsigned int i;
@@ -68,4 +217,4 @@ crc_t crc_update(crc_t crc, const unsigned char *data, size_t data_len)
     }
     return crc & 0xffff;
 }
-
+#endif  // #if defined(CRC_ALGO_TABLE_DRIVEN) || defined(CRC_ALGO_SLICE_BY_8)
@@ -12,6 +12,12 @@
  *    XorOut       = 0x0000
  *    ReflectOut   = True
  *    Algorithm    = bit-by-bit-fast
+ *
+ * The algorithm is selected at compile time (see `CRC_ALGO_*` below):
+ *
+ *  - AVR: bit-by-bit-fast _(no lookup tables in flash/RAM)_.
+ *  - ARM: table-driven _(256-entry table)_.
+ *  - Host: slice-by-8 _(eight 256-entry tables)_.
  *****************************************************************************/
 #ifndef __CRC_16_H__
 #define __CRC_16_H__
@@ -30,8 +36,21 @@ extern "C" {
 
 /**
  * The definition of the used algorithm.
+ *
+ * Define one of `CRC_ALGO_BIT_BY_BIT_FAST`, `CRC_ALGO_TABLE_DRIVEN` or
+ * `CRC_ALGO_SLICE_BY_8` before including this header to override the default
+ * for the target.
  *****************************************************************************/
+#if !defined(CRC_ALGO_BIT_BY_BIT_FAST) && !defined(CRC_ALGO_TABLE_DRIVEN) && \
+    !defined(CRC_ALGO_SLICE_BY_8)
+#if defined(AVR)
 #define CRC_ALGO_BIT_BY_BIT_FAST 1
+#elif defined(__arm__)
+#define CRC_ALGO_TABLE_DRIVEN 1
+#else
+#define CRC_ALGO_SLICE_BY_8 1
+#endif
+#endif
 
 
 /**
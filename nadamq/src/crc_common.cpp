@@ -9,6 +9,17 @@ uint16_t update_crc(uint16_t crc, uint8_t data) {
     return crc;
 }
 
+uint16_t update_crc(uint16_t crc, const uint8_t *data, size_t length) {
+#if defined(AVR)
+    while (length--) {
+        crc = _crc16_update(crc, *data++);
+    }
+#else
+    crc = crc_update(crc, data, length);
+#endif
+    return crc;
+}
+
 uint16_t finalize_crc(uint16_t crc) {
 #if !defined(AVR)
     crc = crc_finalize(crc);
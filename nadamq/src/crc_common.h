@@ -2,6 +2,7 @@
 #define ___CRC_COMMON__H___
 
 #include <stdint.h>
+#include <stdlib.h>
 
 #ifndef AVR
 #include "crc-16.h"
@@ -16,6 +17,7 @@ inline void crc_finalize(...) {}
 
 
 uint16_t update_crc(uint16_t crc, uint8_t data);
+uint16_t update_crc(uint16_t crc, const uint8_t *data, size_t length);
 uint16_t finalize_crc(uint16_t crc);
 
 #endif  // #ifndef ___CRC_COMMON__H___
@@ -17,6 +17,8 @@ action error {
   Serial.println("");
 #endif  // #ifdef ARDUINO_DEBUG
   parse_error_ = true;
+  /* Stop `parse_buffer` at the offending byte. */
+  fbreak;
 }
 
 action startflag_received {
@@ -145,6 +147,8 @@ action length_received {
                    "Buffer length is " << packet_->buffer_size_ << std::endl;
 #endif  // #ifndef AVR
     parse_error_ = true;
+    /* Stop `parse_buffer` before the payload overruns the buffer. */
+    fbreak;
   }
 }
 
@@ -187,6 +191,8 @@ action crc_received {
     /* Reset state of packet, since the parsing was not successful. */
     parse_error_ = true;
   }
+  /* Stop `parse_buffer` after the last byte of the packet. */
+  fbreak;
 }
 
 action ack_received {
@@ -194,6 +200,7 @@ action ack_received {
   std::cout << "[ack_received]" << std::endl;
 #endif  // #ifdef VERBOSE_STATES
   message_completed_ = true;
+  fbreak;
 }
 
 action id_request_received {
@@ -202,6 +209,7 @@ action id_request_received {
   std::cout << "[id_request_received]" << std::endl;
 #endif  // #ifdef VERBOSE_STATES
   message_completed_ = true;
+  fbreak;
 }
 
 action nack_received {
@@ -210,6 +218,7 @@ action nack_received {
 #endif  // #ifdef VERBOSE_STATES
   message_completed_ = true;
   packet_->payload_length_ = payload_bytes_expected_;
+  fbreak;
 }
 
 action packet_err {
@@ -217,6 +226,7 @@ action packet_err {
   std::cout << "[packet_err]" << std::endl;
 #endif  // #ifdef VERBOSE_STATES
   parse_error_ = true;
+  fbreak;
 }
 
 include "packet.rl";
@@ -279,6 +289,12 @@ inline void PacketParser<Packet>::parse_byte(uint8_t *byte) {
 
   %% write exec;
 
+  if (cs == packet_grammar_error) {
+    /* No transition matched the byte, so the machine is stuck in the error
+     * state until the parser is reset. */
+    parse_error_ = true;
+  }
+
 #ifdef ARDUINO_DEBUG
   Serial.print("[p] (");
   Serial.print(cs);
@@ -295,5 +311,48 @@ inline void PacketParser<Packet>::parse_byte(uint8_t *byte) {
 }
 
 
+template <typename Packet>
+inline size_t PacketParser<Packet>::parse_buffer(const uint8_t *data,
+                                                 size_t length) {
+  /*
+   * Run the parser over `length` bytes starting at `data` in a single pass.
+   *
+   * Parsing stops after the byte that completes a packet, or after the byte
+   * that triggers a parse error, so the bytes following a packet are left
+   * untouched for the next call.
+   *
+   * Returns the number of bytes consumed _(including the offending byte in
+   * the case of an error)_.
+   *
+   * __NB__ A completed packet is only reported once, i.e., the
+   * `message_completed_` flag is cleared _(and the packet is reset)_ on entry,
+   * so fields from the previous packet do not leak into the next one.  If
+   * `parse_error_` is set on entry, no bytes are consumed until `reset()` is
+   * called.
+   */
+  if (parse_error_) { return 0; }
+  if (message_completed_) {
+    packet_->reset();
+    message_completed_ = false;
+  }
+  if (length == 0) { return 0; }
+
+  /* The machine only reads through `p`. */
+  p = const_cast<uint8_t *>(data);
+  pe = p + length;
+
+  %% write exec;
+
+  if (cs == packet_grammar_error) {
+    /* No transition matched the byte at `p`.  Count it as consumed. */
+    parse_error_ = true;
+    p++;
+  }
+  return p - data;
+}
+
+
 template void PacketParser<FixedPacket>::reset();
 template void PacketParser<FixedPacket>::parse_byte(uint8_t *);
+template size_t PacketParser<FixedPacket>::parse_buffer(const uint8_t *,
+                                                        size_t);
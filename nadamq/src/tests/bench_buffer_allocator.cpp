@@ -0,0 +1,115 @@
+#include <iostream>
+#include <iomanip>  // `std::setw`
+#include <ctime>
+#include <vector>
+
+#include "BufferAllocator.h"
+
+
+template <size_t BufferSize, size_t Count>
+class LinearScanBufferPool {
+  /* Reference implementation, i.e., the `occupied[]` scan `FixedSizeBufferPool`
+   * used before the intrusive free-list was added. */
+protected:
+  static const size_t padded_buffer_size = sizeof(size_t) + BufferSize;
+  uint8_t super_buffer_[Count * padded_buffer_size];
+  bool occupied[Count];
+  uint32_t next_free;
+  uint32_t free_count;
+public:
+  LinearScanBufferPool() : next_free(0), free_count(Count) {
+    for (size_t i = 0; i < Count; i++) {
+      occupied[i] = false;
+      *((size_t *)&super_buffer_[i * padded_buffer_size]) = i;
+    }
+  }
+
+  size_t available() const { return free_count; }
+
+  uint8_t *buffer_by_id(uint32_t id) const {
+    return (uint8_t *)&super_buffer_[id * padded_buffer_size + sizeof(size_t)];
+  }
+
+  uint8_t *alloc() {
+    if (available() == 0) {
+      return NULL;
+    } else {
+      while (occupied[next_free]) {
+        next_free = (next_free + 1) % Count;
+      }
+      uint8_t *buffer = buffer_by_id(next_free);
+      occupied[next_free] = true;
+      free_count--;
+      return buffer;
+    }
+  }
+
+  bool free(uint8_t *buffer) {
+    size_t buffer_id = *((size_t *)(buffer - sizeof(size_t)));
+    if (buffer_id < Count && occupied[buffer_id]) {
+      occupied[buffer_id] = false;
+      free_count++;
+      return true;
+    }
+    return false;
+  }
+};
+
+
+template <typename Pool>
+double nanoseconds_per_alloc_free(Pool &pool, size_t count,
+                                  std::vector<size_t> const &victims) {
+  /* Fill pool to 90% occupancy, then repeatedly free a pseudo-random occupied
+   * buffer and allocate a replacement. */
+  std::vector<uint8_t *> buffers(count * 9 / 10);
+  for (size_t i = 0; i < buffers.size(); i++) {
+    buffers[i] = pool.alloc();
+  }
+  std::clock_t start = std::clock();
+  for (size_t i = 0; i < victims.size(); i++) {
+    uint8_t *&buffer = buffers[victims[i] % buffers.size()];
+    pool.free(buffer);
+    buffer = pool.alloc();
+  }
+  double seconds = static_cast<double>(std::clock() - start) / CLOCKS_PER_SEC;
+  return 1e9 * seconds / victims.size();
+}
+
+
+template <size_t Count>
+int bench(std::vector<size_t> const &victims) {
+  /* Pools are large, so allocate on the heap. */
+  LinearScanBufferPool<32, Count> *reference =
+    new LinearScanBufferPool<32, Count>();
+  FixedSizeBufferPool<32, Count> *pool = new FixedSizeBufferPool<32, Count>();
+  double reference_ns = nanoseconds_per_alloc_free(*reference, Count, victims);
+  double pool_ns = nanoseconds_per_alloc_free(*pool, Count, victims);
+  int result = (reference->available() == pool->available()) ? 0 : -1;
+  std::cout << std::setw(12) << Count << std::fixed << std::setprecision(1)
+            << std::setw(20) << reference_ns << std::setw(20) << pool_ns
+            << std::setw(9) << reference_ns / pool_ns << "x" << std::endl;
+  delete reference;
+  delete pool;
+  return result;
+}
+
+
+int main(int argc, const char *argv[]) {
+  /* Usage: `bench_buffer_allocator [<alloc/free count>]` */
+  size_t operation_count = (argc > 1) ? atoi(argv[1]) : 2000000;
+
+  std::vector<size_t> victims(operation_count);
+  uint32_t state = 0x12345678;
+  for (size_t i = 0; i < victims.size(); i++) {
+    /* Simple LCG to pick deterministic pseudo-random buffers to free. */
+    state = state * 1103515245 + 12345;
+    victims[i] = state >> 8;
+  }
+
+  std::cout << "# `FixedSizeBufferPool` free+alloc at 90% occupancy #"
+            << std::endl << std::endl;
+  std::cout << std::setw(12) << "buffers" << std::setw(20)
+            << "linear scan (ns)" << std::setw(20) << "free-list (ns)"
+            << std::setw(10) << "speedup" << std::endl;
+  return (bench<16>(victims) || bench<256>(victims) || bench<4096>(victims));
+}
@@ -0,0 +1,94 @@
+#include <iostream>
+#include <algorithm>  // `std::min`
+#include <iomanip>  // `std::setw`
+#include <ctime>
+#include <vector>
+
+#include "crc-16.h"
+
+
+crc_t crc_update_bit_by_bit(crc_t crc, const unsigned char *data,
+                            size_t data_len) {
+  /* Reference bit-by-bit-fast implementation, i.e., the algorithm `crc-16.cpp`
+   * used before the table-driven engines were added. */
+  unsigned int i;
+  bool bit;
+  unsigned char c;
+
+  while (data_len--) {
+    c = *data++;
+    for (i = 0x01; i & 0xff; i <<= 1) {
+      bit = crc & 0x8000;
+      if (c & i) {
+        bit = !bit;
+      }
+      crc <<= 1;
+      if (bit) {
+        crc ^= 0x8005;
+      }
+    }
+    crc &= 0xffff;
+  }
+  return crc & 0xffff;
+}
+
+
+template <typename UpdateFunc>
+double bytes_per_second(UpdateFunc update, std::vector<uint8_t> const &data,
+                        size_t chunk_size, int repeat, crc_t &crc) {
+  std::clock_t start = std::clock();
+  for (int i = 0; i < repeat; i++) {
+    crc = crc_init();
+    for (size_t j = 0; j < data.size(); j += chunk_size) {
+      size_t length = std::min(chunk_size, data.size() - j);
+      crc = update(crc, &data[j], length);
+    }
+  }
+  double seconds = static_cast<double>(std::clock() - start) / CLOCKS_PER_SEC;
+  return (static_cast<double>(data.size()) * repeat) / seconds;
+}
+
+
+int main(int argc, const char *argv[]) {
+  /* Usage: `bench_crc [<data size> [<repeat count>]]` */
+  size_t data_size = (argc > 1) ? atoi(argv[1]) : (1 << 20);
+  int repeat = (argc > 2) ? atoi(argv[2]) : 20;
+
+  std::vector<uint8_t> data(data_size);
+  uint32_t state = 0x12345678;
+  for (size_t i = 0; i < data.size(); i++) {
+    /* Simple LCG to fill the buffer with deterministic pseudo-random bytes. */
+    state = state * 1103515245 + 12345;
+    data[i] = static_cast<uint8_t>(state >> 16);
+  }
+
+  const unsigned char hello[] = "hello, world!";
+  crc_t expected = crc_finalize(crc_update_bit_by_bit(crc_init(), hello, 13));
+  crc_t actual = crc_finalize(crc_update(crc_init(), hello, 13));
+  std::cout << "# CRC-16 benchmark #" << std::endl << std::endl;
+  std::cout << std::hex << std::setw(24) << "'hello, world!': " << actual
+            << " (expected: " << expected << ")" << std::dec << std::endl;
+  if (actual != expected) { return -1; }
+
+  const size_t chunk_sizes[] = {1, 15, 256, data_size};
+  std::cout << std::endl << std::setw(12) << "chunk size" << std::setw(20)
+            << "bit-by-bit (MB/s)" << std::setw(20) << "crc_update (MB/s)"
+            << std::setw(10) << "speedup" << std::endl;
+  for (size_t i = 0; i < sizeof(chunk_sizes) / sizeof(size_t); i++) {
+    crc_t crc_reference = 0, crc_table = 0;
+    double reference = bytes_per_second(crc_update_bit_by_bit, data,
+                                        chunk_sizes[i], repeat, crc_reference);
+    double table = bytes_per_second(crc_update, data, chunk_sizes[i], repeat,
+                                    crc_table);
+    if (crc_reference != crc_table) {
+      std::cerr << "CRC mismatch for chunk size " << chunk_sizes[i]
+                << std::endl;
+      return -1;
+    }
+    std::cout << std::setw(12) << chunk_sizes[i] << std::fixed
+              << std::setprecision(1) << std::setw(20) << reference / 1e6
+              << std::setw(20) << table / 1e6 << std::setw(9)
+              << table / reference << "x" << std::endl;
+  }
+  return 0;
+}
@@ -41,5 +41,13 @@ int main(int argc, const char *argv[]) {
   }
   std::cout << std::endl << std::endl;
   allocator.dump();
+
+  /* Double free, and free of buffer not allocated from pool, are rejected. */
+  uint8_t foreign[8];
+  if (!allocator.free(buffer1) || allocator.free(buffer1) ||
+      allocator.free(foreign) || allocator.available() != 2) {
+    std::cerr << "Invalid free not detected." << std::endl;
+    return -1;
+  }
   return 0;
 }
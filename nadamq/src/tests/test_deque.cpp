@@ -44,5 +44,32 @@ int main(int argc, const char *argv[])
     std::cout << "    " << test.pop_tail() << " (" << test.size() << ")"
               << std::endl;
   }
+
+  /* Interleave appends and pops so items wrap around the end of the ring
+   * buffer. */
+  int next_item = 0;
+  for (int i = 0; i < 20; i++) {
+    while (test.append(next_item)) { next_item++; }
+    for (int j = 0; j < 3; j++) {
+      int expected = next_item - static_cast<int>(test.size());
+      if (test.head() != expected || test.pop_head() != expected) {
+        std::cerr << "Unexpected head (expected " << expected << ")"
+                  << std::endl;
+        return -1;
+      }
+    }
+    if (test.tail() != next_item - 1) {
+      std::cerr << "Unexpected tail." << std::endl;
+      return -1;
+    }
+  }
+
+  /* Zero-capacity deque is always full. */
+  BoundedDeque<int> empty_test(0);
+  if (!empty_test.full() || empty_test.push(0) || empty_test.append(0) ||
+      !empty_test.empty()) {
+    std::cerr << "Unexpected zero-capacity behaviour." << std::endl;
+    return -1;
+  }
   return 0;
 }
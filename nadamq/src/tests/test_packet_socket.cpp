@@ -9,6 +9,7 @@
 #include "PacketAllocator.h"
 #include "PacketHandler.h"
 #include "PacketSocketEvents.h"
+#include "PacketTrace.h"
 #include "stream.hpp"
 
 
@@ -40,8 +41,10 @@ int main(int argc, const char *argv[]) {
   typedef StreamWrapper<std::ifstream, 128> Stream;
   typedef PacketParser<packet_type> packet_parser_type;
   typedef StreamPacketParser<packet_parser_type, Stream> stream_parser_type;
-  typedef PacketAllocator<packet_type, FixedSizeBufferPool<128, 1> > allocator_type;
-  typedef StreamPacketSocket<stream_parser_type, allocator_type> socket_type;
+  typedef PacketAllocator<packet_type, FixedSizeBufferPool<128, 1>,
+                          CountingPacketTrace> allocator_type;
+  typedef StreamPacketSocket<stream_parser_type, allocator_type,
+                             CountingPacketTrace> socket_type;
 
   allocator_type packet_allocator;
   packet_parser_type parser;
@@ -63,6 +66,14 @@ int main(int argc, const char *argv[]) {
       std::cout << std::setw(28) << out.str() << " -> state: "
                 << socket.state() << std::endl;
     }
+
+    std::cout << std::endl << "## Trace counters ##" << std::endl << std::endl;
+    for (int i = 0; i < TRACE_EVENT_COUNT; i++) {
+      PacketTraceEvent event = static_cast<PacketTraceEvent>(i);
+      std::cout << std::setw(20) << trace_event_label(event) << ": "
+                << (packet_allocator.trace_.count(event) +
+                    socket.trace_.count(event)) << std::endl;
+    }
   }
   return 0;
 }
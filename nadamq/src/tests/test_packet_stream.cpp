@@ -54,8 +54,12 @@ class PacketStreamHandler : public PacketHandlerBase<Parser, Stream> {
               packet.payload_length_, queue_packet.payload_buffer_);
     std::cout << std::endl << "## Queue packet into packet stream ##"
               << std::endl << std::endl;
-    packet_stream_.push(queue_packet);
-    std::cout << " - Complete" << std::endl;
+    if (packet_stream_.push(queue_packet)) {
+      std::cout << " - Complete" << std::endl;
+    } else {
+      packet_stream_.allocator()->free_packet_buffer(queue_packet);
+      std::cout << " - Dropped _(queue full)_" << std::endl;
+    }
   }
 
   virtual void handle_error(packet_type &packet) {
@@ -88,7 +92,8 @@ int main(int argc, const char *argv[]) {
 
   typedef FixedPacket packet_type;
   PacketAllocator<packet_type> packet_allocator;
-  PacketStream<PacketAllocator<packet_type> > packet_stream(&packet_allocator);
+  PacketStream<PacketAllocator<packet_type> > packet_stream(&packet_allocator,
+                                                             16);
   packet_type packet = packet_allocator.create_packet();
 
   PacketParser<packet_type> parser;
@@ -127,14 +132,21 @@ int main(int argc, const char *argv[]) {
     dump_byte_counts(packet_stream);
 
     std::cout << std::endl
-              << "# Read stream of payload bytes from packet stream #"
-              << std::endl << std::endl;
+              << "# Read stream of payload bytes from packet stream in chunks "
+              << "using `peek()` and `read_bytes()` #" << std::endl
+              << std::endl;
     std::cout << "    ";
     while (packet_stream.available() > 0) {
-      int value = packet_stream.read();
-      if (value >= 0) {
-        std::cout << static_cast<char>(value);
+      /* Read chunks of 7 bytes, which span packet boundaries. */
+      uint8_t chunk[7];
+      int next_byte = packet_stream.peek();
+      size_t count = packet_stream.read_bytes(chunk, sizeof(chunk));
+      if (count == 0 || chunk[0] != next_byte) {
+        std::cerr << "Unexpected `peek()`/`read_bytes()` result." << std::endl;
+        return -1;
       }
+      std::copy(chunk, chunk + count,
+                std::ostream_iterator<uint8_t>(std::cout, ""));
     }
     std::cout << std::endl << std::endl << "## End of stream ##" << std::endl;
     dump_byte_counts(packet_stream);
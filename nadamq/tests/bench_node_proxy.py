@@ -0,0 +1,85 @@
+# coding: utf-8
+"""
+Benchmark `NodeProxy` request round-trip latency against a loopback stub
+device, which responds to each request packet as soon as it is written.
+
+Usage: `python -m nadamq.tests.bench_node_proxy [-n <request count>]
+[-t memory|socket|pty]`
+
+With the `socket` or `pty` transport, requests are answered by an emulated
+device (see `nadamq.emulator.EchoDevice`) over a socket pair or a pty.
+
+.. versionadded:: 0.16
+"""
+import argparse
+import contextlib
+import os
+import socket
+import time
+
+from nadamq.command_proxy import FileDescriptorStream, NodeProxy, PtyStream, SocketStream
+from nadamq.emulator import EchoDevice
+from nadamq.tests.stubs import EchoRequestManager, ReversedGroupDevice
+
+
+@contextlib.contextmanager
+def loopback_stream(transport):
+    """
+    Yield stream connected to a loopback device over the specified transport.
+    """
+    if transport == 'memory':
+        yield ReversedGroupDevice(group_size=1)
+    elif transport == 'socket':
+        local, remote = socket.socketpair()
+        stream = SocketStream(sock=local)
+        with EchoDevice(SocketStream(sock=remote)):
+            yield stream
+        stream.close()
+    elif transport == 'pty':
+        stream = PtyStream()
+        with EchoDevice(FileDescriptorStream(os.dup(stream.device_fd))):
+            yield stream
+        stream.close()
+    else:
+        raise ValueError(f'Unknown transport: `{transport}`')
+
+
+def main(request_count, payload_size, transport='memory'):
+    payload = bytes(payload_size)
+    requests = [('Echo', {'value': payload})] * request_count
+
+    def _stop_and_wait(stream):
+        proxy = NodeProxy(EchoRequestManager(), stream)
+        for _ in range(request_count):
+            proxy.echo(value=payload)
+
+    def _call_many(stream):
+        NodeProxy(EchoRequestManager(), stream).call_many(requests)
+
+    def _pipelined(stream):
+        with NodeProxy(EchoRequestManager(), stream, max_in_flight=16) as proxy:
+            futures = [proxy.submit('Echo', value=payload) for _ in range(request_count)]
+            for future in futures:
+                future.result()
+
+    print(f'# NodeProxy {transport} loopback round trips ({request_count} requests, '
+          f'{payload_size} byte payload) #')
+    print()
+    print(f'{"mode":>24}{"total (s)":>12}{"per request (us)":>20}')
+    for name, func in [('stop-and-wait', _stop_and_wait),
+                       ('call_many', _call_many),
+                       ('pipelined (16 in flight)', _pipelined)]:
+        with loopback_stream(transport) as stream:
+            start = time.perf_counter()
+            func(stream)
+            duration = time.perf_counter() - start
+        print(f'{name:>24}{duration:>12.3f}{1e6 * duration / request_count:>20.1f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--request-count', type=int, default=10000)
+    parser.add_argument('-s', '--payload-size', type=int, default=16)
+    parser.add_argument('-t', '--transport', choices=['memory', 'socket', 'pty'], default='memory')
+    args = parser.parse_args()
+    main(args.request_count, args.payload_size, args.transport)
@@ -0,0 +1,62 @@
+# coding: utf-8
+"""
+Command request manager and device stubs shared by the `NodeProxy` tests and
+benchmarks.
+
+.. versionadded:: 0.16
+"""
+import threading
+
+from nadamq.command_proxy import Stream
+from nadamq.NadaMq import cPacketParser, PACKET_TYPES, serialize_many
+
+
+class EchoRequestManager:
+    """
+    Minimal command request manager, where each request is encoded as
+    ``b'<command name>:<value>'`` and each response is returned undecoded.
+    """
+    command_names = ['Echo', 'MyCommandA', 'MyCommandB']
+
+    def request(self, request_type_name, value=b''):
+        return request_type_name.encode() + b':' + value
+
+    def response(self, byte_data):
+        return byte_data
+
+
+class ReversedGroupDevice(Stream):
+    """
+    In-memory device stream which responds to each group of
+    :data:`group_size` requests in reverse order, echoing the upper-case
+    request data.
+
+    With ``group_size=1``, each request is answered as soon as it is written.
+    """
+    def __init__(self, group_size=2):
+        self.group_size = group_size
+        self._lock = threading.Lock()
+        self._parser = cPacketParser()
+        self._requests = []
+        self._output = bytearray()
+        self.writes = 0
+
+    def available(self):
+        return len(self._output)
+
+    def read(self, count=None):
+        with self._lock:
+            data = bytes(self._output)
+            del self._output[:]
+            return data
+
+    def write(self, data):
+        with self._lock:
+            self.writes += 1
+            self._requests.extend(self._parser.parse_all(data))
+            count = len(self._requests) - len(self._requests) % self.group_size
+            responses = [(request.iuid, PACKET_TYPES.DATA, request.data().upper())
+                         for i in range(0, count, self.group_size)
+                         for request in reversed(self._requests[i:i + self.group_size])]
+            del self._requests[:count]
+            self._output += serialize_many(responses)
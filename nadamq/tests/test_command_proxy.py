@@ -0,0 +1,197 @@
+# coding: utf-8
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+from nadamq.command_proxy import AsyncNodeProxy, ByteRingBuffer, NodeProxy, Stream
+from nadamq.packet_protocol import PacketProtocol
+from nadamq.NadaMq import cPacket, cPacketParser, PACKET_TYPES
+from nadamq.tests.stubs import EchoRequestManager, ReversedGroupDevice
+
+
+def test_node_proxy():
+    """
+    Test stop-and-wait requests, including a response split across reads.
+
+    .. versionadded:: 0.16
+    """
+    device = ReversedGroupDevice(group_size=1)
+    proxy = NodeProxy(EchoRequestManager(), device)
+    for i in range(3):
+        assert proxy.my_command_a(value=b'%d' % i) == b'MYCOMMANDA:%d' % i
+
+    class SplitReadDevice(ReversedGroupDevice):
+        def read(self, count=None):
+            with self._lock:
+                data, self._output = self._output[:3], self._output[3:]
+                return data
+
+    proxy = NodeProxy(EchoRequestManager(), SplitReadDevice(group_size=1))
+    assert proxy.my_command_b(value=b'split') == b'MYCOMMANDB:SPLIT'
+
+    proxy = NodeProxy(EchoRequestManager(), ReversedGroupDevice(), timeout=.05)
+    with pytest.raises(ValueError, match='Timeout'):
+        proxy.my_command_a()
+
+    class TricklingDevice(ReversedGroupDevice):
+        # Response with a long payload, which arrives one byte per read.
+        def read(self, count=None):
+            with self._lock:
+                data, self._output = self._output[:1], self._output[1:]
+                return data or b'\xff'
+
+        def write(self, data):
+            self._output = b'|||\x00\x00d\x1f\x40'
+
+    # Timeout is enforced even if every read returns bytes.
+    proxy = NodeProxy(EchoRequestManager(), TricklingDevice(), timeout=.001)
+    start = time.time()
+    with pytest.raises(ValueError, match='Timeout'):
+        proxy.my_command_a()
+    assert time.time() - start < 1.
+
+
+class DelayedDevice(Stream):
+    """
+    Device stream which echoes the upper-case request data after a delay,
+    where `read(timeout=...)` blocks until response bytes are available.
+    """
+    def __init__(self, delay=.02):
+        self.delay = delay
+        self.reads = 0
+        self._buffer = ByteRingBuffer()
+        self._parser = cPacketParser()
+
+    def read(self, count=None, timeout=None):
+        self.reads += 1
+        return self._buffer.read(count, timeout)
+
+    def write(self, data):
+        responses = b''.join(cPacket(iuid=request.iuid, type_=PACKET_TYPES.DATA,
+                                     data=request.data().upper()).tobytes()
+                             for request in self._parser.parse_all(data))
+        threading.Timer(self.delay, self._buffer.write, (responses, )).start()
+
+
+def test_node_proxy_blocking_read():
+    """
+    Test that responses are awaited using a blocking read (rather than by
+    polling the stream), if supported by the stream.
+
+    .. versionadded:: 0.16
+    """
+    device = DelayedDevice()
+    proxy = NodeProxy(EchoRequestManager(), device)
+    assert proxy.my_command_a(value=b'x') == b'MYCOMMANDA:X'
+    assert proxy.call_many([('MyCommandB', {'value': b'%d' % i}) for i in range(3)]) == \
+        [b'MYCOMMANDB:%d' % i for i in range(3)]
+    # Flush, then blocking read(s) until the response arrives.
+    assert device.reads <= 6
+
+    proxy = NodeProxy(EchoRequestManager(), DelayedDevice(delay=1.), timeout=.05)
+    with pytest.raises(ValueError, match='Timeout'):
+        proxy.my_command_a()
+
+
+def test_node_proxy_pipelined():
+    """
+    Test that pipelined responses are matched to requests by `iuid`.
+
+    .. versionadded:: 0.16
+    """
+    with NodeProxy(EchoRequestManager(), ReversedGroupDevice(), max_in_flight=2) as proxy:
+        futures = [proxy.submit('MyCommandA', value=b'%d' % i) for i in range(10)]
+        assert [f.result(timeout=1.) for f in futures] == [b'MYCOMMANDA:%d' % i for i in range(10)]
+
+    # Unpaired request is never answered.
+    with NodeProxy(EchoRequestManager(), ReversedGroupDevice(), timeout=.05, max_in_flight=2) as proxy:
+        with pytest.raises(ValueError, match='Timeout'):
+            proxy.my_command_b(value=b'x')
+
+    class CountingDevice(ReversedGroupDevice):
+        reads = 0
+
+        def read(self, count=None):
+            self.reads += 1
+            return super().read(count)
+
+    # Receiver thread does not poll the stream while no requests are pending.
+    device = CountingDevice(group_size=1)
+    with NodeProxy(EchoRequestManager(), device, max_in_flight=2) as proxy:
+        assert proxy.my_command_a(value=b'x') == b'MYCOMMANDA:X'
+        reads = device.reads
+        time.sleep(.05)
+        assert device.reads == reads
+
+
+def test_node_proxy_call_many():
+    """
+    Test that batched requests are sent in a single write, and responses are
+    returned in request order.
+
+    .. versionadded:: 0.16
+    """
+    device = ReversedGroupDevice()
+    proxy = NodeProxy(EchoRequestManager(), device)
+    requests = [('MyCommandA' if i % 2 else 'MyCommandB', {'value': b'%d' % i}) for i in range(50)]
+    expected = [name.upper().encode() + b':%d' % i for i, (name, _) in enumerate(requests)]
+    assert proxy.call_many(requests) == expected
+    assert device.writes == 1
+    assert proxy.call_many([]) == []
+
+    # Pipelined mode writes chunks of at most `max_in_flight` requests.
+    device = ReversedGroupDevice()
+    with NodeProxy(EchoRequestManager(), device, max_in_flight=4) as proxy:
+        assert proxy.call_many(requests) == expected
+    assert device.writes == 13
+
+    class ChattyDevice(ReversedGroupDevice):
+        # Unrelated packet on every read.
+        def read(self, count=None):
+            return cPacket(iuid=0xFFFF, type_=PACKET_TYPES.DATA, data=b'noise').tobytes()
+
+    proxy = NodeProxy(EchoRequestManager(), ChattyDevice(), timeout=.05)
+    with pytest.raises(ValueError, match='Timeout'):
+        proxy.call_many(requests)
+
+
+def test_async_node_proxy_out_of_order():
+    """
+    Test that responses are matched to outstanding requests by `iuid`, even
+    when received out of order.
+
+    .. versionadded:: 0.16
+    """
+    async def _test():
+        loop = asyncio.get_running_loop()
+        local, remote = socket.socketpair()
+        _, protocol = await loop.create_connection(PacketProtocol, sock=local)
+        _, device = await loop.create_connection(PacketProtocol, sock=remote)
+        proxy = AsyncNodeProxy(EchoRequestManager(), protocol)
+
+        async def _respond_reversed():
+            requests = [await device.recv_packet(), await device.recv_packet()]
+            for request in reversed(requests):
+                await device.send_packet(cPacket(iuid=request.iuid, type_=PACKET_TYPES.DATA,
+                                                 data=request.data().upper()))
+
+        try:
+            results = await asyncio.gather(proxy.my_command_a(value=b'a'),
+                                           proxy.my_command_b(value=b'b'),
+                                           _respond_reversed())
+            assert results[:2] == [b'MYCOMMANDA:A', b'MYCOMMANDB:B']
+
+            with pytest.raises(ValueError, match='Timeout'):
+                await asyncio.wait_for(AsyncNodeProxy(EchoRequestManager(), device,
+                                                      timeout=.05).my_command_a(), 1.)
+
+            device.close()
+            with pytest.raises((EOFError, ConnectionError)):
+                await proxy.my_command_a()
+        finally:
+            proxy.close()
+            device.close()
+
+    asyncio.run(_test())
@@ -0,0 +1,58 @@
+# coding: utf-8
+import pytest
+from nadamq.command_proxy import CommandRequestManager
+
+descriptor_pb2 = pytest.importorskip('google.protobuf.descriptor_pb2')
+from google.protobuf import descriptor_pool, message_factory
+
+
+def _message_classes():
+    """
+    Build the message classes described in the
+    :class:`CommandRequestManagerBase` docstring.
+    """
+    file_proto = descriptor_pb2.FileDescriptorProto(name='nadamq_test_commands.proto',
+                                                    package='nadamq_test', syntax='proto2')
+    field = descriptor_pb2.FieldDescriptorProto
+    for name, result_type in [('MyCommandA', field.TYPE_UINT32), ('MyCommandB', field.TYPE_INT32)]:
+        file_proto.message_type.add(name=f'{name}Request').field.add(
+            name='value', number=1, type=field.TYPE_UINT32, label=field.LABEL_OPTIONAL)
+        file_proto.message_type.add(name=f'{name}Response').field.add(
+            name='result', number=1, type=result_type, label=field.LABEL_OPTIONAL)
+    for union in ('Request', 'Response'):
+        message = file_proto.message_type.add(name=f'Command{union}')
+        for number, name in enumerate(['MyCommandA', 'MyCommandB'], 1):
+            message.field.add(name=f'my_command_{"ab"[number - 1]}', number=number,
+                              type=field.TYPE_MESSAGE, label=field.LABEL_OPTIONAL,
+                              type_name=f'.nadamq_test.{name}{union}')
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+
+    def _class(name):
+        descriptor = pool.FindMessageTypeByName(f'nadamq_test.{name}')
+        if hasattr(message_factory, 'GetMessageClass'):
+            return message_factory.GetMessageClass(descriptor)
+        return message_factory.MessageFactory(pool).GetPrototype(descriptor)
+
+    return {name: _class(name) for name in ['MyCommandARequest', 'MyCommandBRequest',
+                                            'MyCommandAResponse', 'MyCommandBResponse',
+                                            'CommandRequest', 'CommandResponse']}
+
+
+def test_command_request_manager():
+    """
+    .. versionadded:: 0.16
+    """
+    classes = _message_classes()
+    manager = CommandRequestManager({'MyCommandA': classes['MyCommandARequest'],
+                                     'MyCommandB': classes['MyCommandBRequest']},
+                                    classes['CommandRequest'], classes['CommandResponse'], None)
+    request = classes['CommandRequest'].FromString(manager.request('MyCommandB', value=42))
+    assert request.my_command_b.value == 42
+    assert not request.HasField('my_command_a')
+
+    response = classes['CommandResponse'](my_command_b=classes['MyCommandBResponse'](result=-7))
+    assert manager.response(response.SerializeToString()) == -7
+    # Empty sub-response (no `result` set) is encoded as a zero length field.
+    response = classes['CommandResponse'](my_command_a=classes['MyCommandAResponse']())
+    assert manager.response(response.SerializeToString()) == 0
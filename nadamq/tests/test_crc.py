@@ -0,0 +1,53 @@
+# coding: utf-8
+import numpy as np
+import pytest
+from nadamq.NadaMq import (compute_crc16, crc16_batch, crc_finalize, crc_init,
+                           crc_update, crc_update_byte)
+
+
+def test_compute_crc16():
+    assert compute_crc16(b'hello, world!') == 0xfa35
+
+
+def test_crc_update_chunked():
+    """
+    Test that the CRC is independent of how the data is split across calls to
+    ``crc_update``/``crc_update_byte``.
+    """
+    data = np.random.RandomState(0).randint(0, 256, 1027).astype('uint8')
+    expected = compute_crc16(data.tobytes())
+
+    crc = crc_init()
+    for i in range(0, len(data), 100):
+        crc = crc_update(crc, data[i:i + 100])
+    assert crc_finalize(crc) == expected
+
+    crc = crc_init()
+    for octet in data:
+        crc = crc_update_byte(crc, octet)
+    assert crc_finalize(crc) == expected
+
+
+def test_crc16_batch():
+    """
+    .. versionadded:: 0.16
+    """
+    data = np.random.RandomState(1).randint(0, 256, 4096).astype('uint8')
+    offsets = np.arange(0, 4000, 37)
+    lengths = np.arange(len(offsets)) % 50
+    expected = [compute_crc16(data[o:o + n].tobytes())
+                for o, n in zip(offsets, lengths)]
+
+    result = crc16_batch(data, offsets, lengths)
+    assert result.dtype == np.uint16
+    assert result.tolist() == expected
+    assert crc16_batch(data, offsets, lengths, num_threads=4).tolist() == expected
+
+    with pytest.raises(ValueError):
+        crc16_batch(data, [4090], [10])
+    # `offset + length` overflows.
+    max_intp = np.iinfo(np.intp).max
+    with pytest.raises(ValueError):
+        crc16_batch(data, [max_intp], [max_intp])
+    with pytest.raises(ValueError):
+        crc16_batch(data, [10], [max_intp])
@@ -1,6 +1,8 @@
 # coding: utf-8
+import numpy as np
 import pytest
-from nadamq.NadaMq import cPacket, PACKET_TYPES
+from nadamq.NadaMq import (cPacket, PACKET_TYPES, serialize_many,
+                          serialize_many_into)
 
 def test_buffer_auto():
     """
@@ -50,3 +52,111 @@ def test_cPacket():
     """
     packet = cPacket(data=b'hello, world!', type_=PACKET_TYPES.DATA)
     assert packet.tobytes() == b'|||\x00\x00d\x00\rhello, world!\xfa5'
+
+def test_payload_view():
+    """
+    Test zero-copy access to the payload through the buffer protocol.
+
+    .. versionadded:: 0.16
+    """
+    p = cPacket(type_=PACKET_TYPES.DATA, data=b'\x01\x00\x02\x00',
+                buffer_size=16)
+    view = p.payload_view()
+    assert len(view) == 4
+    assert np.frombuffer(p, dtype='<u2').tolist() == [1, 2]
+
+    # The view shares memory with the packet payload.
+    view[0] = 3
+    assert p.data() == b'\x03\x00\x02\x00'
+
+    with pytest.raises(BufferError):
+        p.clear_buffer()
+    view.release()
+    p.clear_buffer()
+
+def test_payload_view_no_buffer():
+    """
+    .. versionadded:: 0.16
+    """
+    p = cPacket(type_=PACKET_TYPES.DATA)
+    with pytest.raises(BufferError, match="No buffer has been set/allocated."):
+        memoryview(p)
+
+def test_pack_into():
+    """
+    Test serialization of packets into a preallocated buffer.
+
+    .. versionadded:: 0.16
+    """
+    data = cPacket(data=b'hello, world!', type_=PACKET_TYPES.DATA)
+    ack = cPacket(iuid=1234, type_=PACKET_TYPES.ACK)
+    assert data.serialized_size == len(data.tobytes())
+    assert ack.serialized_size == len(ack.tobytes())
+
+    buffer = bytearray(64)
+    size = data.pack_into(buffer)
+    size += ack.pack_into(buffer, size)
+    assert bytes(buffer[:size]) == data.tobytes() + ack.tobytes()
+
+    with pytest.raises(ValueError):
+        data.pack_into(buffer, 60)
+
+    # Non-contiguous buffers are rejected (rather than written past).
+    array = np.zeros(64, dtype='uint8')
+    for view in (array[::2], array[::-1]):
+        with pytest.raises(ValueError, match='contiguous'):
+            data.pack_into(view)
+    assert not array.any()
+
+def test_nogil_buffer_released():
+    """
+    Test that the payload buffer, which is pinned while accessed with the
+    GIL released, is unpinned once each call returns.
+
+    .. versionadded:: 0.16
+    """
+    packet = cPacket(type_=PACKET_TYPES.DATA, data=b'abc')
+    packet.set_data(b'xyz')
+    packet.tostring()
+    packet.pack_into(bytearray(16))
+    with pytest.raises(ValueError):
+        packet.pack_into(bytearray(4))
+    packet.clear_buffer()
+
+def test_serialize_many():
+    """
+    .. versionadded:: 0.16
+    """
+    packets = [cPacket(iuid=1, type_=PACKET_TYPES.DATA, data=b'hello'),
+               (2, PACKET_TYPES.ACK, None),
+               (3, PACKET_TYPES.STREAM, bytearray(b'world')),
+               (4, PACKET_TYPES.DATA, b'')]
+    expected = b''.join([packets[0].tobytes(),
+                         cPacket(iuid=2, type_=PACKET_TYPES.ACK).tobytes(),
+                         cPacket(iuid=3, type_=PACKET_TYPES.STREAM,
+                                 data=b'world').tobytes(),
+                         cPacket(iuid=4, type_=PACKET_TYPES.DATA,
+                                 data=b'').tobytes()])
+    assert serialize_many(packets) == expected
+
+    buffer = bytearray(len(expected) + 2)
+    assert serialize_many_into(packets, buffer, 2) == len(expected)
+    assert bytes(buffer[2:]) == expected
+
+    # Non-contiguous payloads and buffers are rejected.
+    array = np.arange(10, dtype='uint8')
+    with pytest.raises(ValueError, match='contiguous'):
+        serialize_many([(1, PACKET_TYPES.DATA, array[::2])])
+    output = np.zeros(2 * len(expected), dtype='uint8')
+    with pytest.raises(ValueError, match='contiguous'):
+        serialize_many_into(packets, output[::2])
+    assert not output.any()
+
+    # Packet buffers are only pinned while the frames are written.
+    packet = cPacket(iuid=1, type_=PACKET_TYPES.DATA, data=b'hello')
+    serialize_many([packet])
+    with pytest.raises(ValueError, match='too long'):
+        serialize_many([packet, (2, PACKET_TYPES.DATA, bytes(0x10000))])
+    with pytest.raises(ValueError, match='fit'):
+        serialize_many_into([packet], bytearray(4))
+    packet.clear_buffer()
@@ -1,5 +1,5 @@
 # coding: utf-8
-from nadamq.NadaMq import cPacket, parse_from_string, PACKET_TYPES
+from nadamq.NadaMq import cPacket, cPacketParser, parse_from_string, PACKET_TYPES
 import pytest
 
 def test_parse_data():
@@ -48,3 +48,133 @@ def test_parse_id_request():
 
     assert a.type_ == b.type_
     assert a.iuid == b.iuid
+
+def test_parse_split():
+    """
+    .. versionadded:: 0.16
+    """
+    a = cPacket(iuid=1234, type_=PACKET_TYPES.DATA, data=b'hello, world!')
+    data = a.tobytes()
+    parser = cPacketParser()
+
+    assert parser.parse(data[:7]) is False
+    b = parser.parse(data[7:])
+    assert b.iuid == a.iuid
+    assert b.data() == a.data()
+
+def test_parse_error():
+    """
+    .. versionadded:: 0.16
+    """
+    parser = cPacketParser()
+    # `x` is not a valid packet type.
+    with pytest.raises(RuntimeError, match=r'\[byte=5\]'):
+        parser.parse(b'|||\x00\x00x')
+    # Parser is still in the error state, so no bytes are consumed.
+    with pytest.raises(RuntimeError, match=r'\[byte=0\]'):
+        parser.parse(b'|||')
+    with pytest.raises(RuntimeError, match=r'\[byte=0\]'):
+        parser.parse_all(b'|||')
+
+def test_parse_all():
+    """
+    .. versionadded:: 0.16
+    """
+    packets = [cPacket(iuid=i, type_=PACKET_TYPES.DATA, data=b'data %d' % i)
+               for i in range(3)]
+    packets.insert(1, cPacket(iuid=10, type_=PACKET_TYPES.ACK))
+    data = b''.join(p.tobytes() for p in packets)
+    parser = cPacketParser()
+
+    # Last packet is split across two calls.
+    result = parser.parse_all(data[:-4])
+    result += parser.parse_all(data[-4:])
+
+    assert [(p.iuid, p.type_) for p in result] == \
+        [(p.iuid, p.type_) for p in packets]
+    # The `ACK` packet has no payload (or payload buffer).
+    assert [p.data() for i, p in enumerate(result) if i != 1] == \
+        [b'data %d' % i for i in range(3)]
+
+def test_parse_threads():
+    """
+    Test parsing from several threads, each with its own parser.
+
+    .. versionadded:: 0.16
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _parse(iuid):
+        data = b''.join(cPacket(iuid=iuid, type_=PACKET_TYPES.DATA,
+                                data=bytes(range(200))).tobytes()
+                        for i in range(100))
+        return [(p.iuid, p.data()) for p in cPacketParser().parse_all(data)]
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(_parse, range(8)))
+    for iuid, packets in enumerate(results):
+        assert packets == 100 * [(iuid, bytes(range(200)))]
+
+def test_parse_resync():
+    """
+    Test that a corrupted frame only costs its own bytes in resync mode.
+
+    .. versionadded:: 0.16
+    """
+    frames = [cPacket(iuid=i, type_=PACKET_TYPES.DATA,
+                      data=b'data %d' % i).tobytes() for i in range(3)]
+    # Corrupt the CRC of the second packet.
+    corrupted = frames[1][:-1] + bytes([frames[1][-1] ^ 0xFF])
+    data = b'garbage' + frames[0] + corrupted + frames[2]
+
+    with pytest.raises(RuntimeError):
+        cPacketParser().parse_all(data)
+
+    parser = cPacketParser(resync=True)
+    # Split the data across calls in the middle of the corrupted frame.
+    split = len(data) - len(frames[2]) - 4
+    packets = parser.parse_all(data[:split]) + parser.parse_all(data[split:])
+
+    assert [p.data() for p in packets] == [b'data 0', b'data 2']
+    assert parser.dropped_bytes == len(b'garbage') + len(corrupted)
+    assert parser.resync_count == 2
+
+def test_parse_skip_garbage():
+    """
+    .. versionadded:: 0.16
+    """
+    frames = [cPacket(iuid=i, type_=PACKET_TYPES.DATA,
+                      data=b'data %d' % i).tobytes() for i in range(2)]
+    data = b'debug output | ' + frames[0] + b'\r\n' + frames[1] + b'|'
+
+    parser = cPacketParser(skip_garbage=True)
+    packets = parser.parse_all(data)
+
+    assert [p.data() for p in packets] == [b'data 0', b'data 1']
+    assert parser.skipped_bytes == len(b'debug output | ') + len(b'\r\n')
+    assert parser.dropped_bytes == 0
+
+    # Partial start flag at the end of one buffer, followed by garbage in the
+    # next buffer, is skipped (rather than raising a parse error).
+    parser = cPacketParser(skip_garbage=True)
+    assert parser.parse_all(b'debug |') == []
+    packets = parser.parse_all(b'x more debug\n' + frames[0])
+    assert [p.data() for p in packets] == [b'data 0']
+    assert parser.parse_all(b'||') == []
+    packets = parser.parse_all(b'-' + frames[1])
+    assert [p.data() for p in packets] == [b'data 1']
+    assert parser.skipped_bytes == len(b'debug |x more debug\n') + len(b'||-')
+    assert parser.dropped_bytes == 0
+
+    # Corrupt frame raises, and the parser remains in the error state (rather
+    # than silently dropping the following bytes) until it is reset.
+    parser = cPacketParser(skip_garbage=True)
+    corrupt = frames[0][:-1] + bytes([frames[0][-1] ^ 0xFF])
+    with pytest.raises(RuntimeError):
+        parser.parse_all(b'debug ' + corrupt)
+    skipped_bytes = parser.skipped_bytes
+    with pytest.raises(RuntimeError, match=r'\[byte=0\]'):
+        parser.parse_all(frames[1])
+    assert parser.skipped_bytes == skipped_bytes
+    parser.reset()
+    assert [p.data() for p in parser.parse_all(frames[1])] == [b'data 1']
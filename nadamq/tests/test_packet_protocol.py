@@ -0,0 +1,107 @@
+# coding: utf-8
+import asyncio
+import os
+import pty
+import socket
+import tty
+
+import pytest
+from nadamq.packet_protocol import PacketProtocol, connect_fd
+from nadamq.NadaMq import cPacket, PACKET_TYPES
+
+
+def test_packet_protocol_socket():
+    """
+    Test receiving and sending packets over a socket transport.
+
+    .. versionadded:: 0.16
+    """
+    async def _test():
+        loop = asyncio.get_running_loop()
+        local, remote = socket.socketpair()
+        transport, protocol = await loop.create_connection(PacketProtocol, sock=local)
+        try:
+            packets = [cPacket(iuid=1, type_=PACKET_TYPES.DATA, data=b'hello'),
+                       cPacket(iuid=2, type_=PACKET_TYPES.ACK)]
+            data = b''.join(p.tobytes() for p in packets)
+            # Split the frames across several writes.
+            remote.sendall(data[:4])
+            remote.sendall(data[4:])
+            packet = await protocol.recv_packet(timeout_s=1.)
+            assert (packet.iuid, packet.data()) == (1, b'hello')
+            assert (await protocol.recv_packet(timeout_s=1.)).iuid == 2
+            with pytest.raises(RuntimeError, match='Timed out'):
+                await protocol.recv_packet(timeout_s=.05)
+
+            await protocol.send_packet(packets[0])
+            assert remote.recv(4096) == packets[0].tobytes()
+
+            remote.close()
+            with pytest.raises(EOFError):
+                await protocol.recv_packet(timeout_s=1.)
+            # Closed connection is reported to every subsequent receiver.
+            with pytest.raises(EOFError):
+                await protocol.recv_packet(timeout_s=1.)
+            with pytest.raises(ConnectionError):
+                await protocol.send_packet(packets[0])
+        finally:
+            transport.close()
+
+    asyncio.run(_test())
+
+
+def test_packet_protocol_parse_error():
+    """
+    Test that a corrupted frame is reported, and packets following it in the
+    same chunk are still received.
+
+    .. versionadded:: 0.16
+    """
+    async def _test():
+        loop = asyncio.get_running_loop()
+        local, remote = socket.socketpair()
+        transport, protocol = await loop.create_connection(PacketProtocol, sock=local)
+        try:
+            frames = [cPacket(iuid=i, type_=PACKET_TYPES.DATA, data=b'data %d' % i).tobytes()
+                      for i in range(3)]
+            # Corrupt the CRC of the second frame.
+            frames[1] = frames[1][:-1] + bytes([frames[1][-1] ^ 0xFF])
+            remote.sendall(b''.join(frames))
+            assert (await protocol.recv_packet(timeout_s=1.)).data() == b'data 0'
+            with pytest.raises(RuntimeError, match='Error parsing packet'):
+                await protocol.recv_packet(timeout_s=1.)
+            assert (await protocol.recv_packet(timeout_s=1.)).data() == b'data 2'
+        finally:
+            transport.close()
+            remote.close()
+
+    asyncio.run(_test())
+
+
+def test_packet_protocol_pty():
+    """
+    Test packet round trip over a pty using :func:`connect_fd`.
+
+    .. versionadded:: 0.16
+    """
+    async def _test():
+        master_fd, slave_fd = pty.openpty()
+        # Disable echo/line processing on the device side of the pty.
+        tty.setraw(slave_fd)
+        try:
+            transport, protocol = await connect_fd(master_fd)
+            packet = cPacket(iuid=7, type_=PACKET_TYPES.DATA, data=b'pty')
+            await protocol.send_packet(packet)
+            data = b''
+            while len(data) < len(packet.tobytes()):
+                data += os.read(slave_fd, 4096)
+            assert data == packet.tobytes()
+            os.write(slave_fd, data)
+            response = await protocol.recv_packet(timeout_s=1.)
+            assert (response.iuid, response.data()) == (7, b'pty')
+            protocol.close()
+        finally:
+            os.close(slave_fd)
+            os.close(master_fd)
+
+    asyncio.run(_test())
@@ -0,0 +1,68 @@
+# coding: utf-8
+import os
+
+import pytest
+from nadamq import PacketReader, read_packets
+from nadamq.NadaMq import cPacket, PACKET_TYPES
+
+
+def test_packet_reader_fileno():
+    """
+    Test reading several packets written to a pipe in a single write.
+
+    .. versionadded:: 0.16
+    """
+    read_fd, write_fd = os.pipe()
+    try:
+        with PacketReader(lambda: os.read(read_fd, 4096), fileno=read_fd) as reader:
+            os.write(write_fd, cPacket(iuid=1, type_=PACKET_TYPES.DATA, data=b'hello').tobytes() +
+                     cPacket(iuid=2, type_=PACKET_TYPES.ACK).tobytes())
+            assert reader.read_packet(timeout_s=1.).data() == b'hello'
+            assert reader.read_packet(timeout_s=1.).iuid == 2
+            with pytest.raises(RuntimeError, match='Timed out'):
+                reader.read_packet(timeout_s=.05)
+        with pytest.raises(EOFError):
+            reader.read_packet(timeout_s=1.)
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_packet_reader_poll():
+    """
+    .. versionadded:: 0.16
+    """
+    chunks = [cPacket(iuid=3, type_=PACKET_TYPES.DATA, data=b'world').tobytes()]
+    with PacketReader(lambda: chunks.pop() if chunks else b'') as reader:
+        assert reader.read_packet(timeout_s=1.).data() == b'world'
+
+
+def test_read_packets():
+    """
+    Test that packets split across and sharing reads are all yielded.
+
+    .. versionadded:: 0.16
+    """
+    data = b''.join(cPacket(iuid=i, type_=PACKET_TYPES.DATA, data=b'data %d' % i).tobytes()
+                    for i in range(5))
+    chunks = [data[i:i + 7] for i in range(0, len(data), 7)][::-1]
+
+    packets = read_packets(lambda: chunks.pop() if chunks else b'', timeout_s=.1)
+    assert [next(packets).iuid for i in range(5)] == list(range(5))
+    with pytest.raises(RuntimeError, match='Timed out'):
+        next(packets)
+
+
+def test_read_packets_fileno():
+    """
+    .. versionadded:: 0.16
+    """
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b''.join(cPacket(iuid=i, type_=PACKET_TYPES.ACK).tobytes()
+                                for i in range(3)))
+    os.close(write_fd)
+    try:
+        # Generator stops at the end of the stream.
+        assert [p.iuid for p in read_packets(lambda: os.read(read_fd, 5), fileno=read_fd)] == [0, 1, 2]
+    finally:
+        os.close(read_fd)
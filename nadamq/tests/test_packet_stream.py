@@ -0,0 +1,132 @@
+# coding: utf-8
+import gc
+
+import numpy as np
+import pytest
+from nadamq.NadaMq import cPacket, cPacketParser, cPacketStream, PACKET_TYPES
+
+
+def _stream_packets(data, chunk_size):
+    return [cPacket(iuid=i, type_=PACKET_TYPES.STREAM, data=data[j:j + chunk_size])
+            for i, j in enumerate(range(0, len(data), chunk_size))]
+
+
+def test_packet_stream_read():
+    """
+    Test reading across packet boundaries.
+
+    .. versionadded:: 0.16
+    """
+    data = bytes(range(256)) * 4
+    stream = cPacketStream()
+    stream.extend(_stream_packets(data, 100))
+    assert stream.available == len(stream) == len(data)
+    assert stream.packet_count == 11
+
+    assert stream.read(7) == data[:7]
+    assert stream.read(250) == data[7:257]
+    assert stream.packet_count == 9
+    assert stream.read() == data[257:]
+    assert stream.available == 0
+    assert stream.packet_count == 0
+    assert stream.read(10) == b''
+
+
+def test_packet_stream_readinto():
+    """
+    Test reading directly into preallocated buffers.
+
+    .. versionadded:: 0.16
+    """
+    data = np.arange(1000, dtype='uint16')
+    stream = cPacketStream()
+    stream.extend(_stream_packets(data.tobytes(), 128))
+
+    output = np.empty_like(data)
+    assert stream.readinto(output.view('uint8')[:333]) == 333
+    assert stream.readinto(output.view('uint8')[333:]) == data.nbytes - 333
+    np.testing.assert_array_equal(output, data)
+
+    buffer_ = bytearray(8)
+    assert stream.readinto(buffer_) == 0
+    stream.push(cPacket(type_=PACKET_TYPES.STREAM, data=b'abc'))
+    assert stream.readinto(buffer_) == 3
+    assert buffer_[:3] == b'abc'
+
+
+def test_packet_stream_packets():
+    """
+    Test packet type filter, and that queued payload buffers are held until
+    read.
+
+    .. versionadded:: 0.16
+    """
+    stream = cPacketStream()
+    with pytest.raises(ValueError, match='Unexpected packet type'):
+        stream.push(cPacket(type_=PACKET_TYPES.DATA, data=b'abc'))
+
+    packet = cPacket(type_=PACKET_TYPES.STREAM, data=b'abcdef')
+    stream.push(packet)
+    with pytest.raises(BufferError):
+        packet.clear_buffer()
+    assert stream.read(3) == b'abc'
+    with pytest.raises(BufferError):
+        packet.clear_buffer()
+    assert stream.read(3) == b'def'
+    packet.clear_buffer()
+
+    packet = cPacket(type_=PACKET_TYPES.DATA, data=b'xyz')
+    stream = cPacketStream(packet_type=None)
+    stream.push(packet)
+    stream.clear()
+    assert stream.available == 0
+    packet.clear_buffer()
+
+
+def test_packet_stream_modified_packet():
+    """
+    Test that modifying a queued packet does not corrupt the stream.
+
+    .. versionadded:: 0.16
+    """
+    stream = cPacketStream()
+    packet = cPacket(type_=PACKET_TYPES.STREAM, data=b'abcd', buffer_size=8)
+    stream.push(packet)
+    with pytest.raises(BufferError):
+        packet.set_data(b'NEXT....')
+    assert stream.read() == b'abcd'
+    assert stream.packet_count == 0
+    packet.set_data(b'NEXT')
+
+    # Packet reused by parser is copied when pushed.
+    frames = [cPacket(iuid=i, type_=PACKET_TYPES.STREAM, data=data).tobytes()
+              for i, data in enumerate([b'first', b'2nd'])]
+    parser = cPacketParser()
+    stream.push(parser.parse(frames[0]))
+    stream.push(parser.parse(frames[1]))
+    assert stream.packet_count == 2
+    assert stream.read(3) == b'fir'
+    assert stream.read() == b'st2nd'
+    assert stream.packet_count == 0
+
+
+def test_packet_stream_dealloc():
+    """
+    Test that queued packets are released when a stream is collected,
+    including by the cyclic garbage collector.
+
+    .. versionadded:: 0.16
+    """
+    packets = [cPacket(type_=PACKET_TYPES.STREAM, data=b'abc') for i in range(2)]
+    stream = cPacketStream()
+    stream.push(packets[0])
+    del stream
+    packets[0].clear_buffer()
+
+    stream = cPacketStream()
+    stream.push(packets[1])
+    # Reference cycle through a Python attribute of the stream.
+    stream.packet_type = [stream, PACKET_TYPES.STREAM]
+    del stream
+    gc.collect()
+    packets[1].clear_buffer()
@@ -0,0 +1,117 @@
+# coding: utf-8
+import os
+import pty
+import socket
+import threading
+
+import pytest
+from nadamq.command_proxy import (ByteRingBuffer, FileDescriptorStream, NodeProxy, PtyStream,
+                                  SerialStream, SocketStream)
+from nadamq.emulator import EchoDevice
+from nadamq.NadaMq import cPacket, cPacketParser, PACKET_TYPES
+from nadamq.tests.stubs import EchoRequestManager
+
+
+def test_byte_ring_buffer_wrap():
+    """
+    .. versionadded:: 0.16
+    """
+    buffer_ = ByteRingBuffer(8)
+    buffer_.write(b'abcdef')
+    assert buffer_.read(4) == b'abcd'
+    # Write wraps around the end of the buffer.
+    buffer_.write(b'ghijkl')
+    assert len(buffer_) == 8
+    assert buffer_.read() == b'efghijkl'
+    assert buffer_.read() == b''
+
+
+def test_byte_ring_buffer_blocking():
+    """
+    Test that readers block until requested bytes are available, and writers
+    block while the buffer is full.
+
+    .. versionadded:: 0.16
+    """
+    buffer_ = ByteRingBuffer(4)
+    with pytest.raises(ValueError, match='Timeout'):
+        buffer_.read(1, timeout=.01)
+
+    writer = threading.Thread(target=buffer_.write, args=(b'0123456789', ))
+    writer.start()
+    data = b''.join(buffer_.read(2, timeout=1.) for _ in range(5))
+    writer.join()
+    assert data == b'0123456789'
+
+    # Closing the buffer wakes blocked readers.
+    threading.Timer(.01, buffer_.close).start()
+    with pytest.raises(EOFError):
+        buffer_.read(1, timeout=1.)
+
+
+def test_serial_stream_buffered():
+    """
+    Test buffered serial stream using a pty as the serial device.
+
+    .. versionadded:: 0.16
+    """
+    master_fd, slave_fd = pty.openpty()
+    try:
+        stream = SerialStream(os.ttyname(slave_fd), buffered=True)
+        try:
+            os.write(master_fd, b'hello')
+            assert stream.read(5, timeout=1.) == b'hello'
+            assert stream.available() == 0
+            with pytest.raises(ValueError, match='Timeout'):
+                stream.read(1, timeout=.05)
+            stream.write(b'world')
+            assert os.read(master_fd, 5) == b'world'
+        finally:
+            stream.close()
+    finally:
+        os.close(slave_fd)
+        os.close(master_fd)
+
+
+def test_socket_stream_echo_device():
+    """
+    Test proxy requests to an emulated device over a TCP connection.
+
+    .. versionadded:: 0.16
+    """
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen()
+    with server:
+        stream = SocketStream(server.getsockname())
+        connection, _ = server.accept()
+    with EchoDevice(SocketStream(sock=connection)) as device:
+        proxy = NodeProxy(EchoRequestManager(), stream)
+        assert proxy.echo(value=b'hello') == b'Echo:hello'
+        assert proxy.call_many([('Echo', {'value': b'%d' % i}) for i in range(20)]) == \
+            [b'Echo:%d' % i for i in range(20)]
+
+        stream.write(cPacket(iuid=3, type_=PACKET_TYPES.ID_REQUEST).tobytes())
+        packet = cPacketParser().parse(stream.read(len(b'|||') + 7 + len(device.device_id), timeout=1.))
+        assert (packet.iuid, packet.type_, packet.data()) == (3, PACKET_TYPES.ID_RESPONSE, device.device_id)
+        assert device.request_count == 22
+    stream.close()
+
+
+def test_pty_stream_echo_device():
+    """
+    Test proxy requests to an emulated device serving the device side of a
+    pty.
+
+    .. versionadded:: 0.16
+    """
+    stream = PtyStream()
+    try:
+        with EchoDevice(FileDescriptorStream(os.dup(stream.device_fd))):
+            with NodeProxy(EchoRequestManager(), stream, max_in_flight=8) as proxy:
+                futures = [proxy.submit('Echo', value=b'%d' % i) for i in range(50)]
+                assert [f.result(timeout=1.) for f in futures] == [b'Echo:%d' % i for i in range(50)]
+        with pytest.raises(ValueError, match='Timeout'):
+            stream.read(1, timeout=.01)
+    finally:
+        stream.close()